@@ -34,6 +34,7 @@ from .config import (
     get_config_service,
     get_configuration,
 )
+from .exceptions import WalletError
 from .l402_client import L402Client, L402Error, L402Challenge, L402Token
 from .nwc_wallet import NWCWallet, NWCError, NWCConfig
 from .price_service import (
@@ -64,7 +65,8 @@ __all__ = [
     "L402Error",
     "L402Challenge",
     "L402Token",
-    # NWC Wallet
+    # Wallets
+    "WalletError",
     "NWCWallet",
     "NWCError",
     "NWCConfig",
@@ -5,12 +5,19 @@ Tracks spending limits and payment history for L402 sessions.
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
 
 logger = logging.getLogger("lightning-enable-mcp.budget")
 
+# Upper bound on retained payment records. Keeps memory bounded for
+# long-running sessions — the oldest records are evicted once the limit
+# is reached. Session spend totals are tracked incrementally and are not
+# affected by eviction.
+MAX_HISTORY_RECORDS = 10000
+
 
 class BudgetExceededError(Exception):
     """Exception when a payment would exceed budget limits."""
@@ -18,7 +25,7 @@ class BudgetExceededError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentRecord:
     """Record of a single L402 payment."""
 
@@ -28,16 +35,23 @@ class PaymentRecord:
     invoice: str
     preimage: str
     status: str = "success"  # "success", "failed", "pending"
+    # Serialized view, built lazily on first to_dict() call. Records are
+    # never mutated after creation, so the cache needs no invalidation.
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for serialization."""
-        return {
-            "url": self.url,
-            "amount_sats": self.amount_sats,
-            "timestamp": self.timestamp.isoformat(),
-            "invoice": self.invoice[:20] + "..." if len(self.invoice) > 20 else self.invoice,
-            "status": self.status,
-        }
+        """Convert to dictionary for serialization (cached after first call)."""
+        d = self._dict_cache
+        if d is None:
+            d = {
+                "url": self.url,
+                "amount_sats": self.amount_sats,
+                "timestamp": self.timestamp.isoformat(),
+                "invoice": self.invoice[:20] + "..." if len(self.invoice) > 20 else self.invoice,
+                "status": self.status,
+            }
+            self._dict_cache = d
+        return d
 
 
 @dataclass
@@ -66,25 +80,36 @@ class BudgetManager:
         max_per_session: Maximum satoshis allowed for entire session
         auto_approve_sats: Payments at or below this are auto-approved
         session_spent: Total satoshis spent in this session
-        payments: List of payment records
+        payments: Bounded deque of payment records (oldest evicted first)
     """
 
     max_per_request: int = 10000
     max_per_session: int = 100000
     auto_approve_sats: int = 1000  # ~$1 - payments above this need confirmation
     session_spent: int = 0
-    payments: list[PaymentRecord] = field(default_factory=list)
-
-    def check_payment(self, amount_sats: int, max_override: int | None = None) -> None:
+    # Row-oriented storage is deliberate: `payments` is public API and the
+    # hot aggregates never scan it — session totals are maintained
+    # incrementally and per-record dicts are cached on the record.
+    payments: "deque[PaymentRecord]" = field(
+        default_factory=lambda: deque(maxlen=MAX_HISTORY_RECORDS)
+    )
+
+    def try_check_payment(
+        self, amount_sats: int, max_override: int | None = None
+    ) -> tuple[bool, str | None]:
         """
-        Check if a payment is within budget limits.
+        Check if a payment is within budget limits, without raising.
+
+        Rejections are normal control flow on agent retry loops, so this
+        variant returns the outcome instead of paying for exception
+        raising and unwinding per denial.
 
         Args:
             amount_sats: Amount to check in satoshis
             max_override: Optional per-request limit override
 
-        Raises:
-            BudgetExceededError: If payment would exceed limits
+        Returns:
+            (True, None) if the payment fits, else (False, reason)
         """
         effective_max = min(
             max_override if max_override is not None else self.max_per_request,
@@ -93,18 +118,59 @@ class BudgetManager:
 
         # Check per-request limit
         if amount_sats > effective_max:
-            raise BudgetExceededError(
+            return False, (
                 f"Payment of {amount_sats} sats exceeds per-request limit of {effective_max} sats"
             )
 
         # Check session limit
         remaining = self.max_per_session - self.session_spent
         if amount_sats > remaining:
-            raise BudgetExceededError(
+            return False, (
                 f"Payment of {amount_sats} sats would exceed session limit. "
                 f"Remaining budget: {remaining} sats"
             )
 
+        return True, None
+
+    def can_spend(self, amount_sats: int, max_override: int | None = None) -> bool:
+        """
+        Pure boolean budget check — two int compares, no message building.
+
+        For callers that only need to know whether a payment would fit
+        (e.g. short-circuiting before scheduling any wallet coroutine)
+        and don't want the denial reason string.
+
+        Args:
+            amount_sats: Amount to check in satoshis
+            max_override: Optional per-request limit override
+
+        Returns:
+            True if the payment fits within both limits
+        """
+        effective_max = min(
+            max_override if max_override is not None else self.max_per_request,
+            self.max_per_request,
+        )
+        return (
+            amount_sats <= effective_max
+            and amount_sats <= self.max_per_session - self.session_spent
+        )
+
+    def check_payment(self, amount_sats: int, max_override: int | None = None) -> None:
+        """
+        Check if a payment is within budget limits.
+
+        Args:
+            amount_sats: Amount to check in satoshis
+            max_override: Optional per-request limit override
+
+        Raises:
+            BudgetExceededError: If payment would exceed limits
+        """
+        ok, reason = self.try_check_payment(amount_sats, max_override)
+        if not ok:
+            raise BudgetExceededError(reason)
+
     def record_payment(
         self,
         url: str,
@@ -138,10 +204,12 @@ class BudgetManager:
         self.payments.append(record)
 
         if status == "success":
+            # Running counter: budget checks stay O(1) no matter how long
+            # the payment history grows.
             self.session_spent += amount_sats
             logger.info(
-                f"Recorded payment: {amount_sats} sats to {url}. "
-                f"Session total: {self.session_spent}/{self.max_per_session} sats"
+                "Recorded payment: %d sats to %s. Session total: %d/%d sats",
+                amount_sats, url, self.session_spent, self.max_per_session,
             )
 
         return record
@@ -161,15 +229,19 @@ class BudgetManager:
         Returns:
             List of PaymentRecords, most recent first
         """
-        records = self.payments
-
-        if since:
-            records = [r for r in records if r.timestamp >= since]
-
-        # Sort by timestamp descending
-        records = sorted(records, key=lambda r: r.timestamp, reverse=True)
-
-        return records[:limit]
+        # Payments append in chronological order, so walking the deque from
+        # the newest end yields records already sorted descending; stop at
+        # the first record older than `since` or once `limit` is reached.
+        # Replaces the previous filter-everything-then-sort pass.
+        records: list[PaymentRecord] = []
+        for record in reversed(self.payments):
+            if since is not None and record.timestamp < since:
+                break
+            records.append(record)
+            if len(records) >= limit:
+                break
+
+        return records
 
     def configure(
         self,
@@ -256,6 +256,23 @@ class BudgetService:
             f"Session total: {self._session_spent_sats} sats (${self._session_spent_usd:.2f})"
         )
 
+    def record_payment(self, amount_sats: int) -> None:
+        """
+        Records a completed payment: spend tracking and cooldown in one call.
+
+        Equivalent to record_spend(amount_sats) followed by
+        record_payment_time(), but takes the timestamp once. Prefer this
+        from tool code after a successful payment.
+
+        Args:
+            amount_sats: Amount spent in satoshis.
+
+        Raises:
+            ValueError: If amount is negative.
+        """
+        self.record_spend(amount_sats)
+        self._last_payment_time = datetime.now(timezone.utc)
+
     def record_payment_time(self) -> None:
         """
         Records that a payment was just made (for cooldown tracking).
@@ -424,6 +441,23 @@ class BudgetService:
         )
 
     # Read-only properties for session state
+    @property
+    def cooldown_active(self) -> bool:
+        """Whether the inter-payment cooldown is still in effect."""
+        return not self._is_cooldown_elapsed()
+
+    @property
+    def remaining_session_budget_usd(self) -> Decimal:
+        """
+        Remaining session budget in USD, based on the tracked session spend.
+
+        Cheap accessor for response building — unlike get_status() it does
+        not assemble the full configuration/price status tree.
+        """
+        config = self._config_service.configuration
+        session_limit_usd = config.limits.max_per_session or Decimal("999999999")
+        return max(Decimal("0"), session_limit_usd - self._session_spent_usd)
+
     @property
     def session_spent_sats(self) -> int:
         """Total satoshis spent in this session."""
@@ -420,6 +420,7 @@ class ConfigurationService:
         self._config_directory = home_dir / ".lightning-enable"
         self._config_file_path = self._config_directory / "config.json"
         self._config_file_exists = False
+        self._config_file_mtime: Optional[float] = None
         self._configuration = self._load_configuration()
 
     @property
@@ -438,7 +439,19 @@ class ConfigurationService:
         return self._config_file_exists
 
     def reload(self) -> None:
-        """Reloads configuration from disk."""
+        """
+        Reloads configuration from disk.
+
+        Cheap when nothing changed: the file is stat'd first and the cached
+        configuration is kept if the mtime matches the last load, so callers
+        can invoke this freely without re-parsing JSON on every call.
+        """
+        try:
+            mtime = self._config_file_path.stat().st_mtime
+            if self._config_file_mtime is not None and mtime == self._config_file_mtime:
+                return
+        except OSError:
+            pass
         self._configuration = self._load_configuration()
 
     def _load_configuration(self) -> UserBudgetConfiguration:
@@ -446,6 +459,7 @@ class ConfigurationService:
         try:
             if self._config_file_path.exists():
                 self._config_file_exists = True
+                self._config_file_mtime = self._config_file_path.stat().st_mtime
                 with open(self._config_file_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
 
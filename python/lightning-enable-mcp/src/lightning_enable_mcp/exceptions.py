@@ -0,0 +1,12 @@
+"""
+Shared Exceptions
+
+Common base classes for errors raised across wallet backends, so callers
+can catch one type instead of enumerating every backend's exception.
+"""
+
+
+class WalletError(Exception):
+    """Base exception for all wallet backend errors (NWC, OpenNode, Strike, LND)."""
+
+    pass
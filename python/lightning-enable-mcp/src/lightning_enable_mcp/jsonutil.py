@@ -0,0 +1,60 @@
+"""
+JSON Serialization Helpers
+
+Thin wrapper over orjson (a fast Rust-backed JSON library) with a
+transparent stdlib fallback when orjson isn't installed. Tool responses
+are serialized on every call, so routing them through one helper applies
+the fast path consistently instead of per call site.
+
+Output is always a str, decoded once from orjson's bytes on the fast
+path. Tools deliberately do not return raw bytes: MCP's TextContent
+model requires text, so the decode here is the only str/bytes
+conversion a response pays before it reaches the transport.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+# Indentation is for humans reading a transcript; agents parse either way.
+# Hot payment paths pass indent=PRETTY so production defaults to compact
+# output, while LIGHTNING_ENABLE_PRETTY_JSON=1 restores indentation for
+# debugging.
+PRETTY = os.getenv("LIGHTNING_ENABLE_PRETTY_JSON") == "1"
+
+
+def _default(obj: Any) -> Any:
+    """Serialize Decimal amounts as JSON numbers."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def dumps(obj: Any, *, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (orjson fast path)."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON from a str or bytes payload (orjson fast path)."""
+        return orjson.loads(data)
+
+else:
+
+    def dumps(obj: Any, *, indent: bool = False) -> str:
+        """Serialize obj to a JSON string (stdlib fallback)."""
+        return json.dumps(obj, default=_default, indent=2 if indent else None)
+
+    def loads(data: str | bytes) -> Any:
+        """Parse JSON from a str or bytes payload (stdlib fallback)."""
+        return json.loads(data)
@@ -5,9 +5,10 @@ Handles L402 protocol for HTTP requests with automatic payment.
 """
 
 import base64
+import functools
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import httpx
@@ -18,6 +19,58 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("lightning-enable-mcp.l402")
 
+# Upper bound on how much of a response body is buffered in memory. The
+# access_l402_resource tool shows at most 5000 characters of the body, so
+# there is no reason to hold a multi-megabyte payload; 256 KiB leaves
+# generous headroom for callers that parse the response.
+MAX_RESPONSE_BYTES = 256 * 1024
+
+# WWW-Authenticate parsing patterns, compiled once at import. Challenge
+# parsing runs on every 402 response; hoisting the patterns avoids re's
+# per-call cache lookups (and recompiles if that cache ever evicts).
+_L402_SCHEME_RE = re.compile(r'^\s*(L402|LSAT)\s+', re.IGNORECASE)
+_MACAROON_RE = re.compile(r'macaroon\s*=\s*"([^"]+)"')
+_INVOICE_RE = re.compile(r'invoice\s*=\s*"([^"]+)"')
+_MPP_METHOD_RE = re.compile(r'method\s*=\s*"([^"]+)"', re.IGNORECASE)
+_MPP_INVOICE_RE = re.compile(r'invoice\s*=\s*"([^"]+)"', re.IGNORECASE)
+_MPP_AMOUNT_RE = re.compile(r'amount\s*=\s*"([^"]+)"', re.IGNORECASE)
+_MPP_REALM_RE = re.compile(r'realm\s*=\s*"([^"]+)"', re.IGNORECASE)
+# Matches the start of a known auth scheme at the start of a segment or
+# after a comma, used to split multi-challenge header values.
+_SCHEME_BOUNDARY_RE = re.compile(r"(?i)(?:^|,\s*)(?=(?:l402|lsat|payment)\s)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_l402_header(www_authenticate: str) -> "tuple[str, str]":
+    """
+    Extract (macaroon, invoice) from an L402/LSAT WWW-Authenticate value.
+
+    Pure function of the header string, so repeated challenges — servers
+    commonly re-issue the same header across retries — become a dict
+    lookup instead of three regex scans. Failures raise L402Error and are
+    not cached; malformed headers are rare and cheap to re-reject.
+
+    Raises:
+        L402Error: If header cannot be parsed
+    """
+    # Handle both L402 and legacy LSAT (case-insensitive per HTTP spec),
+    # allowing any valid HTTP whitespace (SP / HTAB) and multiple characters.
+    scheme_match = _L402_SCHEME_RE.match(www_authenticate)
+    if not scheme_match:
+        raise L402Error(f"Invalid L402 challenge: {www_authenticate[:50]}")
+
+    # Extract macaroon (allow optional whitespace around '=' per HTTP auth-param OWS rules)
+    macaroon_match = _MACAROON_RE.search(www_authenticate)
+    if not macaroon_match:
+        raise L402Error("Missing macaroon in L402 challenge")
+
+    # Extract invoice (allow optional whitespace around '=' per HTTP auth-param OWS rules)
+    invoice_match = _INVOICE_RE.search(www_authenticate)
+    if not invoice_match:
+        raise L402Error("Missing invoice in L402 challenge")
+
+    return macaroon_match.group(1), invoice_match.group(1)
+
 
 class L402Error(Exception):
     """Exception for L402-related errors."""
@@ -37,23 +90,29 @@ class L402BudgetExceededError(L402Error):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class L402Challenge:
     """Parsed L402 challenge from WWW-Authenticate header."""
 
     macaroon: str
     invoice: str
     amount_msat: int | None = None
+    # Computed once at construction; challenges are read many times per
+    # payment flow but never change after parsing.
+    _amount_sats: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.amount_msat is not None:
+            # Ceiling division to avoid sub-sat amounts rounding to 0
+            self._amount_sats = -(-self.amount_msat // 1000)
 
     @property
     def amount_sats(self) -> int | None:
-        """Return amount in satoshis (ceiling division to avoid sub-sat amounts rounding to 0)."""
-        if self.amount_msat is not None:
-            return -(-self.amount_msat // 1000)  # ceil division
-        return None
+        """Return amount in satoshis (precomputed, ceiling division)."""
+        return self._amount_sats
 
 
-@dataclass
+@dataclass(slots=True)
 class MppChallenge:
     """Parsed MPP (Machine Payments Protocol) challenge from WWW-Authenticate header.
     Per IETF draft-ryan-httpauth-payment. No macaroon — just invoice + preimage."""
@@ -62,36 +121,50 @@ class MppChallenge:
     amount: str | None = None
     realm: str | None = None
     amount_msat: int | None = None
+    _amount_sats: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.amount_msat is not None:
+            # Ceiling division to avoid sub-sat amounts rounding to 0
+            self._amount_sats = -(-self.amount_msat // 1000)
 
     @property
     def amount_sats(self) -> int | None:
-        """Return amount in satoshis (ceiling division to avoid sub-sat amounts rounding to 0)."""
-        if self.amount_msat is not None:
-            return -(-self.amount_msat // 1000)  # ceil division
-        return None
+        """Return amount in satoshis (precomputed, ceiling division)."""
+        return self._amount_sats
 
 
-@dataclass
+@dataclass(slots=True)
 class L402Token:
     """L402 authorization token (macaroon + preimage)."""
 
     macaroon: str
     preimage: str
+    # Tokens are immutable once minted and the header is re-sent on every
+    # retried request, so the string is assembled once here.
+    _header: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._header = f"L402 {self.macaroon}:{self.preimage}"
 
     def to_header(self) -> str:
         """Format as Authorization header value."""
-        return f"L402 {self.macaroon}:{self.preimage}"
+        return self._header
 
 
-@dataclass
+@dataclass(slots=True)
 class MppToken:
     """MPP authorization token (preimage only, no macaroon)."""
 
     preimage: str
+    _header: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._header = f'Payment method="lightning", preimage="{self.preimage}"'
 
     def to_header(self) -> str:
         """Format as Authorization header value."""
-        return f'Payment method="lightning", preimage="{self.preimage}"'
+        return self._header
 
 
 class L402Client:
@@ -133,23 +206,7 @@ class L402Client:
         Raises:
             L402Error: If header cannot be parsed
         """
-        # Handle both L402 and legacy LSAT (case-insensitive per HTTP spec),
-        # allowing any valid HTTP whitespace (SP / HTAB) and multiple characters.
-        scheme_match = re.match(r'^\s*(L402|LSAT)\s+', www_authenticate, re.IGNORECASE)
-        if not scheme_match:
-            raise L402Error(f"Invalid L402 challenge: {www_authenticate[:50]}")
-
-        # Extract macaroon (allow optional whitespace around '=' per HTTP auth-param OWS rules)
-        macaroon_match = re.search(r'macaroon\s*=\s*"([^"]+)"', www_authenticate)
-        if not macaroon_match:
-            raise L402Error("Missing macaroon in L402 challenge")
-        macaroon = macaroon_match.group(1)
-
-        # Extract invoice (allow optional whitespace around '=' per HTTP auth-param OWS rules)
-        invoice_match = re.search(r'invoice\s*=\s*"([^"]+)"', www_authenticate)
-        if not invoice_match:
-            raise L402Error("Missing invoice in L402 challenge")
-        invoice = invoice_match.group(1)
+        macaroon, invoice = _parse_l402_header(www_authenticate)
 
         # Parse invoice to get amount
         amount_msat = self._get_invoice_amount_msat(invoice)
@@ -179,19 +236,19 @@ class L402Client:
 
         params_str = parts[1] if len(parts) > 1 else ""
 
-        method_match = re.search(r'method\s*=\s*"([^"]+)"', params_str, re.IGNORECASE)
+        method_match = _MPP_METHOD_RE.search(params_str)
         if not method_match or method_match.group(1).lower() != "lightning":
             raise L402Error("MPP challenge method must be 'lightning'")
 
-        invoice_match = re.search(r'invoice\s*=\s*"([^"]+)"', params_str, re.IGNORECASE)
+        invoice_match = _MPP_INVOICE_RE.search(params_str)
         if not invoice_match:
             raise L402Error("Missing invoice in MPP challenge")
         invoice = invoice_match.group(1)
 
-        amount_match = re.search(r'amount\s*=\s*"([^"]+)"', params_str, re.IGNORECASE)
+        amount_match = _MPP_AMOUNT_RE.search(params_str)
         amount = amount_match.group(1) if amount_match else None
 
-        realm_match = re.search(r'realm\s*=\s*"([^"]+)"', params_str, re.IGNORECASE)
+        realm_match = _MPP_REALM_RE.search(params_str)
         realm = realm_match.group(1) if realm_match else None
 
         amount_msat = self._get_invoice_amount_msat(invoice)
@@ -234,15 +291,11 @@ class L402Client:
         Returns:
             List of individual challenge strings
         """
-        # Pattern matches the start of a known auth scheme (case-insensitive).
-        # We look for scheme names at the start of a segment or after a comma.
-        scheme_boundary = re.compile(r"(?i)(?:^|,\s*)(?=(?:l402|lsat|payment)\s)", re.IGNORECASE)
-
         expanded: list[str] = []
         for value in www_auth_values:
             if not value or not value.strip():
                 continue
-            matches = list(scheme_boundary.finditer(value))
+            matches = list(_SCHEME_BOUNDARY_RE.finditer(value))
             if len(matches) <= 1:
                 # Single challenge (or no recognized scheme) — keep as-is
                 expanded.append(value.strip())
@@ -353,63 +406,100 @@ class L402Client:
         headers = headers or {}
         content = body.encode() if body else None
 
-        # Initial request
-        response = await self._http_client.request(
-            method=method, url=url, headers=headers, content=content
-        )
-
-        # Check for L402 challenge
-        if response.status_code == 402:
-            # Use get_list to properly handle multiple WWW-Authenticate headers
-            # (httpx may comma-join them into a single string otherwise)
-            www_auth_values = response.headers.get_list("WWW-Authenticate")
-            if not www_auth_values:
-                raise L402Error("402 response without WWW-Authenticate header")
-
-            # Parse each header value separately, preferring L402 over MPP
-            challenge = self._select_best_challenge(www_auth_values)
-
-            # Reject no-amount invoices (security: could bypass budget checks)
-            if challenge.amount_sats is None or challenge.amount_sats <= 0:
-                raise L402Error(
-                    "Invoice has no amount specified. For security, only invoices with explicit amounts are supported."
-                )
-
-            # Check budget
-            if challenge.amount_sats > max_sats:
-                raise L402BudgetExceededError(
-                    f"Invoice amount {challenge.amount_sats} sats exceeds maximum {max_sats} sats"
-                )
+        # Initial request. Streamed so the body is only pulled in up to
+        # MAX_RESPONSE_BYTES — a 402 challenge needs headers only, and the
+        # success path never shows more than a bounded prefix.
+        response = await self._send_streaming(method, url, headers, content)
+        try:
+            # Check for L402 challenge
+            if response.status_code == 402:
+                # Use get_list to properly handle multiple WWW-Authenticate headers
+                # (httpx may comma-join them into a single string otherwise)
+                www_auth_values = response.headers.get_list("WWW-Authenticate")
+                if not www_auth_values:
+                    raise L402Error("402 response without WWW-Authenticate header")
+
+                # Parse each header value separately, preferring L402 over MPP
+                challenge = self._select_best_challenge(www_auth_values)
+            else:
+                # Handle other error responses
+                if response.status_code >= 400:
+                    text = await self._read_bounded(response)
+                    raise L402Error(f"Request failed: {response.status_code} {text[:200]}")
 
-            # Pay invoice
-            protocol = "MPP" if isinstance(challenge, MppChallenge) else "L402"
-            logger.info(f"Paying {protocol} invoice for {challenge.amount_sats} sats")
-            preimage = await self.wallet.pay_invoice(challenge.invoice)
+                return await self._read_bounded(response), None
+        finally:
+            await response.aclose()
 
-            # Create token
-            if isinstance(challenge, MppChallenge):
-                token = MppToken(preimage=preimage)
-            else:
-                token = L402Token(macaroon=challenge.macaroon, preimage=preimage)
+        # Reject no-amount invoices (security: could bypass budget checks)
+        if challenge.amount_sats is None or challenge.amount_sats <= 0:
+            raise L402Error(
+                "Invoice has no amount specified. For security, only invoices with explicit amounts are supported."
+            )
 
-            # Retry with authorization
-            auth_headers = {**headers, "Authorization": token.to_header()}
-            response = await self._http_client.request(
-                method=method, url=url, headers=auth_headers, content=content
+        # Check budget
+        if challenge.amount_sats > max_sats:
+            raise L402BudgetExceededError(
+                f"Invoice amount {challenge.amount_sats} sats exceeds maximum {max_sats} sats"
             )
 
+        # Pay invoice
+        protocol = "MPP" if isinstance(challenge, MppChallenge) else "L402"
+        logger.info(f"Paying {protocol} invoice for {challenge.amount_sats} sats")
+        preimage = await self.wallet.pay_invoice(challenge.invoice)
+
+        # Create token
+        if isinstance(challenge, MppChallenge):
+            token = MppToken(preimage=preimage)
+        else:
+            token = L402Token(macaroon=challenge.macaroon, preimage=preimage)
+
+        # Retry with authorization
+        auth_headers = {**headers, "Authorization": token.to_header()}
+        response = await self._send_streaming(method, url, auth_headers, content)
+        try:
             if response.status_code >= 400:
+                text = await self._read_bounded(response)
                 raise L402Error(
-                    f"Request failed after payment: {response.status_code} {response.text[:200]}"
+                    f"Request failed after payment: {response.status_code} {text[:200]}"
                 )
 
-            return response.text, challenge.amount_sats
+            return await self._read_bounded(response), challenge.amount_sats
+        finally:
+            await response.aclose()
 
-        # Handle other error responses
-        if response.status_code >= 400:
-            raise L402Error(f"Request failed: {response.status_code} {response.text[:200]}")
+    async def _send_streaming(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        content: bytes | None,
+    ) -> httpx.Response:
+        """Send a request without eagerly buffering the response body."""
+        request = self._http_client.build_request(
+            method=method, url=url, headers=headers, content=content
+        )
+        return await self._http_client.send(request, stream=True)
 
-        return response.text, None
+    async def _read_bounded(self, response: httpx.Response) -> str:
+        """
+        Read a streamed response body, capped at MAX_RESPONSE_BYTES.
+
+        Bodies larger than the cap are truncated rather than buffered in
+        full — the callers only ever surface a bounded prefix anyway.
+        """
+        chunks: list[bytes] = []
+        total = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            total += len(chunk)
+            if total >= MAX_RESPONSE_BYTES:
+                logger.warning(
+                    f"Response body exceeded {MAX_RESPONSE_BYTES} bytes; truncating"
+                )
+                break
+        data = b"".join(chunks)[:MAX_RESPONSE_BYTES]
+        return data.decode(response.encoding or "utf-8", errors="replace")
 
     async def pay_challenge(
         self,
@@ -33,10 +33,12 @@ try:
 except ImportError:
     httpx = None  # type: ignore
 
+from .exceptions import WalletError
+
 logger = logging.getLogger("lightning-enable-mcp.lnd")
 
 
-class LndError(Exception):
+class LndError(WalletError):
     """Exception for LND-related errors."""
     pass
 
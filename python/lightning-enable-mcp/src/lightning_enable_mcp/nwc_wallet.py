@@ -13,15 +13,17 @@ import secrets
 import time
 from dataclasses import dataclass, replace
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import unquote_plus
 
 import websockets
 from websockets.client import WebSocketClientProtocol
 
+from .exceptions import WalletError
+
 logger = logging.getLogger("lightning-enable-mcp.nwc")
 
 
-class NWCError(Exception):
+class NWCError(WalletError):
     """Exception for NWC-related errors."""
 
     pass
@@ -97,7 +99,7 @@ NWC_FAIL_PROTOCOL = "protocol_error"
 NWC_FAIL_UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class NWCConfig:
     """Parsed NWC connection configuration."""
 
@@ -112,26 +114,43 @@ class NWCConfig:
         Parse a nostr+walletconnect:// URI.
 
         Format: nostr+walletconnect://<pubkey>?relay=<relay_url>&secret=<secret>
+
+        The URI shape is fixed, so the string is split directly instead of
+        going through urlparse/parse_qs. Values are still percent-decoded
+        (relay URLs are routinely encoded), but only when they need it.
         """
         if not uri.startswith("nostr+walletconnect://"):
             raise ValueError("Invalid NWC URI: must start with nostr+walletconnect://")
 
-        # Parse the URI
-        parsed = urlparse(uri)
-
-        # Extract pubkey from netloc
-        wallet_pubkey = parsed.netloc
+        # Drop any fragment first (urlparse did this too), then split off the
+        # query. A trailing slash after the pubkey is tolerated for parity
+        # with the old urlparse-based parser.
+        rest = uri[len("nostr+walletconnect://"):]
+        rest, _, _ = rest.partition("#")
+        wallet_pubkey, _, query = rest.partition("?")
+        wallet_pubkey = wallet_pubkey.rstrip("/")
         if not wallet_pubkey:
             raise ValueError("Invalid NWC URI: missing wallet pubkey")
-
-        # Parse query parameters
-        params = parse_qs(parsed.query)
-
-        relay_url = params.get("relay", [None])[0]
+        try:
+            # One C-level hex decode validates the pubkey; no regex needed.
+            bytes.fromhex(wallet_pubkey)
+        except ValueError:
+            raise ValueError("Invalid NWC URI: wallet pubkey is not valid hex") from None
+
+        # Parse query parameters (first occurrence wins, as with parse_qs)
+        params: dict[str, str] = {}
+        if query:
+            for pair in query.split("&"):
+                key, _, value = pair.partition("=")
+                if "%" in value or "+" in value:
+                    value = unquote_plus(value)
+                params.setdefault(key, value)
+
+        relay_url = params.get("relay")
         if not relay_url:
             raise ValueError("Invalid NWC URI: missing relay parameter")
 
-        secret = params.get("secret", [None])[0]
+        secret = params.get("secret")
         if not secret:
             raise ValueError("Invalid NWC URI: missing secret parameter")
 
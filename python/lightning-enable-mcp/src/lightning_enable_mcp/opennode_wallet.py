@@ -15,10 +15,12 @@ try:
 except ImportError:
     httpx = None  # type: ignore
 
+from .exceptions import WalletError
+
 logger = logging.getLogger("lightning-enable-mcp.opennode")
 
 
-class OpenNodeError(Exception):
+class OpenNodeError(WalletError):
     """Exception for OpenNode-related errors."""
     pass
 
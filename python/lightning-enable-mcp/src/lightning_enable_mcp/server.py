@@ -8,6 +8,9 @@ import asyncio
 import logging
 import os
 import sys
+from collections.abc import Sequence
+from contextvars import ContextVar
+from types import MappingProxyType
 from typing import Any
 
 from mcp.server import Server
@@ -68,6 +71,46 @@ def _sanitize_error(msg: str) -> str:
     return msg
 
 
+# Optional per-context overrides for the service handles. Dispatch reads
+# these with the instance attribute as the default, so they stay unset in
+# normal operation and every call uses the owning server's handles; an
+# embedder can set them inside a copied context to swap services for a
+# single request without threading kwargs through every handler. They are
+# deliberately never set by the server itself — a module-level set() would
+# shadow the per-instance defaults for every other server in the process.
+_WALLET_CTX: ContextVar[Any] = ContextVar("lightning_enable_wallet")
+_STRIKE_WALLET_CTX: ContextVar[Any] = ContextVar("lightning_enable_strike_wallet")
+_L402_CLIENT_CTX: ContextVar[Any] = ContextVar("lightning_enable_l402_client")
+_BUDGET_MANAGER_CTX: ContextVar[Any] = ContextVar("lightning_enable_budget_manager")
+_BUDGET_SERVICE_CTX: ContextVar[Any] = ContextVar("lightning_enable_budget_service")
+_API_CLIENT_CTX: ContextVar[Any] = ContextVar("lightning_enable_api_client")
+
+# Hoisted argument defaults for the dispatch hot path. Literal defaults in
+# arguments.get(...) calls are rebuilt on every invocation ({} in particular
+# allocates a fresh dict per call); these are shared instead. The empty
+# headers mapping is a read-only proxy so accidental mutation fails loudly.
+_EMPTY_HEADERS: MappingProxyType = MappingProxyType({})
+_DEFAULT_METHOD = "GET"
+_DEFAULT_MAX_SATS = 1000
+_DEFAULT_HISTORY_LIMIT = 10
+_DEFAULT_PER_REQUEST_SATS = 1000
+_DEFAULT_PER_SESSION_SATS = 10000
+_DEFAULT_INVOICE_EXPIRY_SECS = 3600
+
+# Shared response for the no-wallet error branch. The content never varies,
+# so one TextContent instance is built at import time and handed back in a
+# single-element tuple (the MCP framework accepts any sequence of content
+# blocks; tuples are cheaper to allocate than lists and this one is shared).
+_NO_WALLET_RESPONSE: tuple[TextContent, ...] = (
+    TextContent(
+        type="text",
+        text="Error: No wallet configured. "
+        "Set LND_REST_HOST+LND_MACAROON_HEX, NWC_CONNECTION_STRING, "
+        "STRIKE_API_KEY, or OPENNODE_API_KEY environment variable.",
+    ),
+)
+
+
 class LightningEnableServer:
     """MCP Server for L402 Lightning payments."""
 
@@ -454,100 +497,102 @@ class LightningEnableServer:
             ]
 
         @self.server.call_tool()
-        async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent]:
             """Handle tool invocations."""
             try:
                 # Ensure services are initialized
                 if self.wallet is None or self.l402_client is None:
                     await self._initialize_services()
 
+                # Resolve service handles once, up front. Context overrides
+                # win; otherwise fall back to the instance attributes.
+                wallet = _WALLET_CTX.get(self.wallet)
+                strike_wallet = _STRIKE_WALLET_CTX.get(self.strike_wallet)
+                l402_client = _L402_CLIENT_CTX.get(self.l402_client)
+                budget_manager = _BUDGET_MANAGER_CTX.get(self.budget_manager)
+                budget_service = _BUDGET_SERVICE_CTX.get(self.budget_service)
+                api_client = _API_CLIENT_CTX.get(self.api_client)
+
                 # Tools that don't require a wallet connection
                 producer_tools = {"create_l402_challenge", "verify_l402_payment", "discover_api", "confirm_payment"}
 
-                if self.wallet is None and name not in producer_tools:
-                    return [
-                        TextContent(
-                            type="text",
-                            text="Error: No wallet configured. "
-                            "Set LND_REST_HOST+LND_MACAROON_HEX, NWC_CONNECTION_STRING, "
-                            "STRIKE_API_KEY, or OPENNODE_API_KEY environment variable.",
-                        )
-                    ]
+                if wallet is None and name not in producer_tools:
+                    return _NO_WALLET_RESPONSE
 
                 # Route to appropriate handler
                 if name == "access_l402_resource":
                     result = await access_l402_resource(
                         url=arguments["url"],
-                        method=arguments.get("method", "GET"),
-                        headers=arguments.get("headers", {}),
+                        method=arguments.get("method", _DEFAULT_METHOD),
+                        headers=arguments.get("headers") or _EMPTY_HEADERS,
                         body=arguments.get("body"),
-                        max_sats=arguments.get("max_sats", 1000),
+                        max_sats=arguments.get("max_sats", _DEFAULT_MAX_SATS),
                         confirmed=arguments.get("confirmed", False),
-                        l402_client=self.l402_client,
-                        budget_manager=self.budget_manager,
-                        budget_service=self.budget_service,
+                        l402_client=l402_client,
+                        budget_manager=budget_manager,
+                        budget_service=budget_service,
                     )
 
                 elif name == "pay_l402_challenge":
                     result = await pay_l402_challenge(
                         invoice=arguments["invoice"],
                         macaroon=arguments.get("macaroon"),
-                        max_sats=arguments.get("max_sats", 1000),
-                        wallet=self.wallet,
-                        budget_manager=self.budget_manager,
+                        max_sats=arguments.get("max_sats", _DEFAULT_MAX_SATS),
+                        wallet=wallet,
+                        budget_manager=budget_manager,
                     )
 
                 elif name == "check_wallet_balance":
-                    result = await check_wallet_balance(wallet=self.wallet)
+                    result = await check_wallet_balance(wallet=wallet)
 
                 elif name == "get_payment_history":
                     result = await get_payment_history(
-                        limit=arguments.get("limit", 10),
+                        limit=arguments.get("limit", _DEFAULT_HISTORY_LIMIT),
                         since=arguments.get("since"),
-                        budget_manager=self.budget_manager,
+                        budget_manager=budget_manager,
                     )
 
                 elif name == "configure_budget":
                     result = await configure_budget(
-                        per_request=arguments.get("per_request", 1000),
-                        per_session=arguments.get("per_session", 10000),
-                        budget_manager=self.budget_manager,
+                        per_request=arguments.get("per_request", _DEFAULT_PER_REQUEST_SATS),
+                        per_session=arguments.get("per_session", _DEFAULT_PER_SESSION_SATS),
+                        budget_manager=budget_manager,
                     )
 
                 elif name == "pay_invoice":
                     result = await pay_invoice(
                         invoice=arguments.get("invoice", ""),
-                        max_sats=arguments.get("max_sats", 1000),
+                        max_sats=arguments.get("max_sats", _DEFAULT_MAX_SATS),
                         confirmed=arguments.get("confirmed", False),
-                        wallet=self.wallet,
-                        budget_manager=self.budget_manager,
-                        budget_service=self.budget_service,
+                        wallet=wallet,
+                        budget_manager=budget_manager,
+                        budget_service=budget_service,
                     )
 
                 elif name == "create_invoice":
                     result = await create_invoice(
                         amount_sats=arguments.get("amount_sats", 0),
                         memo=arguments.get("memo"),
-                        expiry_secs=arguments.get("expiry_secs", 3600),
-                        wallet=self.wallet,
+                        expiry_secs=arguments.get("expiry_secs", _DEFAULT_INVOICE_EXPIRY_SECS),
+                        wallet=wallet,
                     )
 
                 elif name == "check_invoice_status":
                     result = await check_invoice_status(
                         invoice_id=arguments.get("invoice_id", ""),
-                        wallet=self.wallet,
+                        wallet=wallet,
                     )
 
                 elif name == "get_all_balances":
                     result = await get_all_balances(
-                        wallet=self.wallet,
-                        strike_wallet=self.strike_wallet,
-                        budget_service=self.budget_service,
+                        wallet=wallet,
+                        strike_wallet=strike_wallet,
+                        budget_service=budget_service,
                     )
 
                 elif name == "get_btc_price":
                     result = await get_btc_price(
-                        wallet=self.strike_wallet,
+                        wallet=strike_wallet,
                     )
 
                 elif name == "exchange_currency":
@@ -555,24 +600,24 @@ class LightningEnableServer:
                         source_currency=arguments.get("source_currency", ""),
                         target_currency=arguments.get("target_currency", ""),
                         amount=arguments.get("amount", 0),
-                        wallet=self.strike_wallet,
+                        wallet=strike_wallet,
                     )
 
                 elif name == "send_onchain":
                     # send_onchain supports Strike and LND wallets
-                    onchain_wallet = self.strike_wallet
-                    if onchain_wallet is None and isinstance(self.wallet, LndWallet):
-                        onchain_wallet = self.wallet
+                    onchain_wallet = strike_wallet
+                    if onchain_wallet is None and isinstance(wallet, LndWallet):
+                        onchain_wallet = wallet
                     result = await send_onchain(
                         address=arguments.get("address", ""),
                         amount_sats=arguments.get("amount_sats", 0),
                         wallet=onchain_wallet,
-                        budget_service=self.budget_service,
+                        budget_service=budget_service,
                     )
 
                 elif name == "get_budget_status":
                     result = await get_budget_status(
-                        budget_service=self.budget_service,
+                        budget_service=budget_service,
                     )
 
                 elif name == "create_l402_challenge":
@@ -580,20 +625,20 @@ class LightningEnableServer:
                         resource=arguments.get("resource", ""),
                         price_sats=arguments.get("price_sats", 0),
                         description=arguments.get("description"),
-                        api_client=self.api_client,
+                        api_client=api_client,
                     )
 
                 elif name == "verify_l402_payment":
                     result = await verify_l402_payment(
                         macaroon=arguments.get("macaroon", ""),
                         preimage=arguments.get("preimage", ""),
-                        api_client=self.api_client,
+                        api_client=api_client,
                     )
 
                 elif name == "confirm_payment":
                     result = await confirm_payment(
                         nonce=arguments.get("nonce", ""),
-                        budget_service=self.budget_service,
+                        budget_service=budget_service,
                     )
 
                 elif name == "discover_api":
@@ -602,19 +647,19 @@ class LightningEnableServer:
                         query=arguments.get("query"),
                         category=arguments.get("category"),
                         budget_aware=arguments.get("budget_aware", True),
-                        budget_service=self.budget_service,
+                        budget_service=budget_service,
                     )
 
                 else:
                     result = f"Unknown tool: {name}"
 
-                return [TextContent(type="text", text=str(result))]
+                return (TextContent(type="text", text=str(result)),)
 
             except Exception as e:
                 logger.exception(f"Error in tool {name}")
                 # Sanitize exception message to avoid leaking credentials
                 safe_msg = _sanitize_error(str(e))
-                return [TextContent(type="text", text=f"Error in {name}: {safe_msg}")]
+                return (TextContent(type="text", text=f"Error in {name}: {safe_msg}"),)
 
     async def _initialize_services(self) -> None:
         """Initialize wallet, L402 client, and budget manager.
@@ -690,7 +735,8 @@ class LightningEnableServer:
             else:
                 selected = None
 
-            # Initialize wallet based on priority
+            # Build wallet based on priority; connects are gathered below so
+            # independent backends don't serialize their handshakes.
             if selected == "lnd":
                 logger.info("Initializing LND wallet (L402 compatible, direct node)...")
                 self.wallet = LndWallet(
@@ -698,14 +744,10 @@ class LightningEnableServer:
                     macaroon_hex=lnd_macaroon_hex,
                     skip_tls_verify=lnd_skip_tls_verify,
                 )
-                await self.wallet.connect()
-                logger.info("LND wallet connected - preimage always available")
             elif selected == "nwc":
                 logger.info("Initializing NWC wallet (L402 compatible)...")
                 self._nwc_config = NWCConfig.from_uri(nwc_connection)
                 self.wallet = NWCWallet(nwc_connection)
-                await self.wallet.connect()
-                logger.info("NWC wallet connected - preimage support available")
             elif selected == "opennode":
                 logger.info("Initializing OpenNode wallet...")
                 environment = os.getenv("OPENNODE_ENVIRONMENT", "production")
@@ -715,23 +757,59 @@ class LightningEnableServer:
                     api_key=opennode_api_key,
                     environment=environment,
                 )
-                await self.wallet.connect()
-                logger.info(f"OpenNode wallet connected ({environment})")
-                logger.warning("OpenNode may not return preimage - L402 may not work")
             elif selected == "strike":
                 logger.info("Initializing Strike wallet...")
                 self.wallet = StrikeWallet(api_key=strike_api_key)
-                await self.wallet.connect()
-                logger.info("Strike wallet connected - preimage support available via lightning.preImage")
 
             # Also initialize Strike for Strike-specific features if available
             if has_strike and not isinstance(self.wallet, StrikeWallet):
                 logger.info("Initializing Strike wallet for multi-currency features...")
                 self.strike_wallet = StrikeWallet(api_key=strike_api_key)
-                await self.strike_wallet.connect()
             elif isinstance(self.wallet, StrikeWallet):
                 self.strike_wallet = self.wallet
 
+            # Connect the primary wallet and the secondary Strike wallet in
+            # parallel — they are independent services, so there is no reason
+            # to pay both handshakes back to back. return_exceptions keeps a
+            # failed sibling from leaving the other task un-awaited; any
+            # wallet that did connect is disconnected before the error is
+            # surfaced so its HTTP client doesn't leak.
+            connect_targets = []
+            if self.wallet is not None:
+                connect_targets.append(self.wallet)
+            if self.strike_wallet is not None and self.strike_wallet is not self.wallet:
+                connect_targets.append(self.strike_wallet)
+            if connect_targets:
+                results = await asyncio.gather(
+                    *(w.connect() for w in connect_targets),
+                    return_exceptions=True,
+                )
+                failure = next(
+                    (r for r in results if isinstance(r, BaseException)), None
+                )
+                if failure is not None:
+                    for target, result in zip(connect_targets, results):
+                        if isinstance(result, BaseException):
+                            continue
+                        try:
+                            await target.disconnect()
+                        except Exception as close_error:
+                            logger.warning(
+                                "Error disconnecting wallet after failed init: %s",
+                                close_error,
+                            )
+                    raise failure
+
+            if selected == "lnd":
+                logger.info("LND wallet connected - preimage always available")
+            elif selected == "nwc":
+                logger.info("NWC wallet connected - preimage support available")
+            elif selected == "opennode":
+                logger.info(f"OpenNode wallet connected ({environment})")
+                logger.warning("OpenNode may not return preimage - L402 may not work")
+            elif selected == "strike":
+                logger.info("Strike wallet connected - preimage support available via lightning.preImage")
+
             # Initialize budget manager (legacy)
             max_per_request = int(os.getenv("L402_MAX_SATS_PER_REQUEST", "1000"))
             max_per_session = int(os.getenv("L402_MAX_SATS_PER_SESSION", "10000"))
@@ -753,6 +831,43 @@ class LightningEnableServer:
             logger.exception("Failed to initialize services")
             raise RuntimeError(f"Failed to initialize: {e!s}") from e
 
+    async def shutdown(self) -> None:
+        """
+        Release all external resources (wallet connections, HTTP clients).
+
+        Called from the entry point's finally block so that Ctrl-C or
+        SIGTERM doesn't leave the NWC WebSocket, wallet HTTP sessions, or
+        price-service client dangling. Each step is best-effort — a failure
+        closing one resource must not prevent closing the rest.
+        """
+        from . import price_service as price_service_module
+
+        # Only close the price service if one was actually created — calling
+        # get_price_service() here would instantiate it just to close it.
+        price_service = price_service_module._default_service
+
+        closers = [
+            ("wallet", self.wallet.disconnect if self.wallet else None),
+            (
+                "strike wallet",
+                self.strike_wallet.disconnect
+                if self.strike_wallet and self.strike_wallet is not self.wallet
+                else None,
+            ),
+            ("L402 client", self.l402_client.close if self.l402_client else None),
+            ("API client", self.api_client.close if self.api_client else None),
+            ("price service", price_service.close if price_service else None),
+        ]
+        for resource, closer in closers:
+            if closer is None:
+                continue
+            try:
+                await closer()
+            except Exception as e:
+                logger.warning(f"Error closing {resource} during shutdown: {e}")
+
+        logger.info("Shutdown complete")
+
     async def run(self) -> None:
         """Run the MCP server."""
         logger.info("Starting Lightning Enable MCP server...")
@@ -765,13 +880,33 @@ class LightningEnableServer:
             )
 
 
-def main() -> None:
-    """Entry point for the MCP server."""
+async def _main() -> None:
+    """Run the server, releasing wallet/HTTP resources on the way out."""
+    import signal
+
     server = LightningEnableServer()
 
+    # Translate SIGTERM into task cancellation so the finally block runs
+    # (asyncio.run already handles SIGINT by raising KeyboardInterrupt).
+    # add_signal_handler is unavailable on Windows event loops — skip there.
+    loop = asyncio.get_running_loop()
+    main_task = asyncio.current_task()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, main_task.cancel)
+    except (NotImplementedError, AttributeError):
+        pass
+
+    try:
+        await server.run()
+    finally:
+        await server.shutdown()
+
+
+def main() -> None:
+    """Entry point for the MCP server."""
     try:
-        asyncio.run(server.run())
-    except KeyboardInterrupt:
+        asyncio.run(_main())
+    except (KeyboardInterrupt, asyncio.CancelledError):
         logger.info("Server stopped by user")
         sys.exit(0)
     except Exception as e:
@@ -14,6 +14,7 @@ Get your API key from: https://dashboard.strike.me/
 
 import logging
 import asyncio
+import time
 from dataclasses import dataclass, field
 from typing import Any
 from decimal import Decimal
@@ -23,14 +24,48 @@ try:
 except ImportError:
     httpx = None  # type: ignore
 
+from . import jsonutil
+from .exceptions import WalletError
+
 logger = logging.getLogger("lightning-enable-mcp.strike")
 
 BASE_URL = "https://api.strike.me/v1"
 
+# How long a fetched BTC/USD ticker stays fresh. Short enough to keep the
+# price near spot, long enough to absorb bursts of price lookups without a
+# round trip to Strike for each one.
+TICKER_CACHE_SECONDS = 30.0
+
+# Satoshis per Bitcoin, built once — Decimal construction is not free and
+# the conversion shows up on every balance/fee path.
+SATS_PER_BTC = Decimal(100_000_000)
+
+# Currencies Strike supports for exchange. Frozenset gives O(1) membership
+# checks without rebuilding a literal tuple on every call.
+_EXCHANGE_CURRENCIES = frozenset({"USD", "BTC"})
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """
+    Convert an API value (str/int/float/None) to Decimal.
+
+    Strike amounts arrive as JSON strings or numbers; the Decimal(str(...))
+    dance was repeated at every call site. Ints short-circuit (exact, no
+    string round-trip) and None maps to zero.
+    """
+    if value is None:
+        return Decimal(0)
+    if isinstance(value, (int, Decimal)):
+        return Decimal(value)
+    return Decimal(str(value))
+
 
-class StrikeError(Exception):
+class StrikeError(WalletError):
     """Exception for Strike-related errors."""
-    pass
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
 
 
 class StrikePaymentError(StrikeError):
@@ -38,13 +73,13 @@ class StrikePaymentError(StrikeError):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class StrikeConfig:
     """Strike configuration."""
     api_key: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrencyBalance:
     """Balance for a single currency."""
     currency: str
@@ -53,7 +88,7 @@ class CurrencyBalance:
     pending: Decimal = Decimal("0")
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiCurrencyBalance:
     """Multi-currency balance result."""
     success: bool
@@ -70,7 +105,7 @@ class MultiCurrencyBalance:
         return cls(success=False, error_code=code, error_message=message)
 
 
-@dataclass
+@dataclass(slots=True)
 class TickerResult:
     """BTC price ticker result."""
     success: bool
@@ -87,7 +122,7 @@ class TickerResult:
         return cls(success=False, error_code=code, error_message=message)
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangeResult:
     """Currency exchange result."""
     success: bool
@@ -131,7 +166,7 @@ class ExchangeResult:
         return cls(success=False, error_code=code, error_message=message)
 
 
-@dataclass
+@dataclass(slots=True)
 class OnChainResult:
     """On-chain payment result."""
     success: bool
@@ -194,6 +229,11 @@ class StrikeWallet:
         self.config = StrikeConfig(api_key=api_key)
         self._client: httpx.AsyncClient | None = None
         self._connected = False
+        self._ticker_cache: TickerResult | None = None
+        self._ticker_cached_at: float = 0.0
+        # Whether GET /balances/{currency} is available. Cleared on the
+        # first 404 so later balance checks go straight to the full list.
+        self._per_currency_balances = True
 
     async def connect(self) -> None:
         """Initialize the HTTP client."""
@@ -208,6 +248,15 @@ class StrikeWallet:
                 "Accept": "application/json",
             },
             timeout=30.0,
+            # Keep a small pool of warm connections to api.strike.me so the
+            # quote -> execute -> poll sequence reuses one TLS session
+            # instead of paying the handshake on each request. The expiry
+            # comfortably covers the 2s payment-poll interval.
+            limits=httpx.Limits(
+                max_connections=10,
+                max_keepalive_connections=5,
+                keepalive_expiry=30.0,
+            ),
         )
         self._connected = True
         logger.info("Strike wallet connected")
@@ -246,13 +295,20 @@ class StrikeWallet:
             )
 
             if response.status_code >= 400:
-                error_text = response.text
-                raise StrikeError(f"API error ({response.status_code}): {error_text}")
+                # Bounded decode — avoids httpx's charset detection and a
+                # full unicode decode of a potentially huge error body.
+                error_text = response.content[:500].decode("utf-8", "replace")
+                raise StrikeError(
+                    f"API error ({response.status_code}): {error_text}",
+                    status_code=response.status_code,
+                )
 
             if response.status_code == 204:  # No content
                 return {}
 
-            return response.json()
+            # Parse the raw bytes directly — skips httpx's charset handling
+            # and uses the orjson fast path when available.
+            return jsonutil.loads(response.content)
 
         except httpx.RequestError as e:
             raise StrikeError(f"Request failed: {e!s}") from e
@@ -274,7 +330,7 @@ class StrikeWallet:
         Raises:
             StrikePaymentError: If payment fails
         """
-        logger.info(f"Paying invoice via Strike: {bolt11[:30]}...")
+        logger.info("Paying invoice via Strike: %s...", bolt11[:30])
 
         try:
             # Step 1: Create payment quote
@@ -289,14 +345,14 @@ class StrikeWallet:
             if not quote_id:
                 raise StrikePaymentError("No payment quote ID returned")
 
-            logger.info(f"Quote created: {quote_id}")
+            logger.info("Quote created: %s", quote_id)
 
             # Step 2: Execute the payment
             payment = await self._request("PATCH", f"/payment-quotes/{quote_id}/execute")
             payment_id = payment.get("paymentId", quote_id)
             state = payment.get("state", "UNKNOWN")
 
-            logger.info(f"Payment executed: {payment_id}, state: {state}")
+            logger.info("Payment executed: %s, state: %s", payment_id, state)
 
             # Step 3: Poll for completion if pending
             if state == "PENDING":
@@ -304,7 +360,7 @@ class StrikeWallet:
                 state = payment.get("state", "UNKNOWN")
 
             if state == "COMPLETED":
-                logger.info(f"Payment completed: {payment_id}")
+                logger.info("Payment completed: %s", payment_id)
 
                 # Extract preimage from lightning.preImage (Strike API)
                 lightning_details = payment.get("lightning", {})
@@ -327,11 +383,20 @@ class StrikeWallet:
     async def _wait_for_payment(
         self, payment_id: str, timeout_secs: int = 60
     ) -> dict[str, Any]:
-        """Poll for payment completion."""
-        end_time = asyncio.get_event_loop().time() + timeout_secs
-        poll_interval = 2.0
+        """Poll for payment completion with exponential backoff.
 
-        while asyncio.get_event_loop().time() < end_time:
+        Most Lightning payments settle within a second or two, so polling
+        starts at 0.5s to catch them quickly, then backs off 1.5x per
+        attempt (capped at 5s) to avoid hammering the API on slow payments.
+        """
+        # Resolve the loop once — asyncio.get_event_loop() re-resolves the
+        # running loop (with a deprecation path) on every call.
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + timeout_secs
+        poll_interval = 0.5
+        max_poll_interval = 5.0
+
+        while loop.time() < end_time:
             try:
                 payment = await self._request("GET", f"/payments/{payment_id}")
                 if payment.get("state") != "PENDING":
@@ -339,7 +404,12 @@ class StrikeWallet:
             except StrikeError:
                 pass
 
-            await asyncio.sleep(poll_interval)
+            # Don't oversleep past the deadline.
+            remaining = end_time - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(poll_interval, remaining))
+            poll_interval = min(poll_interval * 1.5, max_poll_interval)
 
         return {"paymentId": payment_id, "state": "TIMEOUT"}
 
@@ -351,15 +421,33 @@ class StrikeWallet:
             Balance in satoshis
         """
         try:
+            # Prefer the single-currency endpoint: one row to fetch and
+            # parse instead of every currency on the account.
+            if self._per_currency_balances:
+                try:
+                    balance = await self._request("GET", "/balances/BTC")
+                except StrikeError as e:
+                    if e.status_code != 404:
+                        raise
+                    # Endpoint not available; use the full list from now on.
+                    self._per_currency_balances = False
+                else:
+                    current = balance.get("current") or balance.get("available")
+                    if current:
+                        sats = int(_to_decimal(current) * SATS_PER_BTC)
+                        logger.info("Strike balance: %d sats", sats)
+                        return sats
+                    return 0
+
             balances = await self._request("GET", "/balances")
 
             for balance in balances:
                 if balance.get("currency", "").upper() == "BTC":
                     current = balance.get("current") or balance.get("available")
                     if current:
-                        btc = Decimal(str(current))
-                        sats = int(btc * 100_000_000)
-                        logger.info(f"Strike balance: {sats} sats")
+                        btc = _to_decimal(current)
+                        sats = int(btc * SATS_PER_BTC)
+                        logger.info("Strike balance: %d sats", sats)
                         return sats
 
             return 0
@@ -395,26 +483,20 @@ class StrikeWallet:
         try:
             balances_data = await self._request("GET", "/balances")
 
-            balances = []
-            for b in balances_data:
-                currency = b.get("currency", "").upper()
-                if not currency:
-                    continue
-
-                available = Decimal(str(b.get("available") or b.get("current") or "0"))
-                total = Decimal(str(b.get("total") or available))
-                pending = Decimal(str(b.get("pending") or "0"))
-
-                balances.append(
-                    CurrencyBalance(
-                        currency=currency,
-                        available=available,
-                        total=total,
-                        pending=pending,
-                    )
+            # Comprehension instead of for/append: no repeated .append
+            # lookup and no incremental list resizing.
+            balances = [
+                CurrencyBalance(
+                    currency=currency,
+                    available=(available := _to_decimal(b.get("available") or b.get("current"))),
+                    total=_to_decimal(b.get("total") or available),
+                    pending=_to_decimal(b.get("pending")),
                 )
+                for b in balances_data
+                if (currency := b.get("currency", "").upper())
+            ]
 
-            logger.info(f"Retrieved {len(balances)} currency balances")
+            logger.info("Retrieved %d currency balances", len(balances))
             return MultiCurrencyBalance.succeeded(balances)
 
         except StrikeError as e:
@@ -425,8 +507,12 @@ class StrikeWallet:
         Get current BTC/USD price from Strike.
 
         Returns:
-            TickerResult with BTC/USD price
+            TickerResult with BTC/USD price (cached up to TICKER_CACHE_SECONDS)
         """
+        cached = self._ticker_cache
+        if cached is not None and time.monotonic() - self._ticker_cached_at < TICKER_CACHE_SECONDS:
+            return cached
+
         try:
             tickers = await self._request("GET", "/rates/ticker")
 
@@ -436,9 +522,14 @@ class StrikeWallet:
                 if source == "BTC" and target == "USD":
                     amount = ticker.get("amount")
                     if amount:
-                        price = Decimal(str(amount))
-                        logger.info(f"BTC/USD: ${price:,.2f}")
-                        return TickerResult.succeeded(price)
+                        price = _to_decimal(amount)
+                        logger.info("BTC/USD: $%s", format(price, ",.2f"))
+                        result = TickerResult.succeeded(price)
+                        # Only successful lookups are cached — failures
+                        # should retry on the next call.
+                        self._ticker_cache = result
+                        self._ticker_cached_at = time.monotonic()
+                        return result
 
             return TickerResult.failed("NO_RATE", "BTC/USD rate not found")
 
@@ -465,7 +556,7 @@ class StrikeWallet:
         source_currency = source_currency.upper()
         target_currency = target_currency.upper()
 
-        if source_currency not in ("USD", "BTC") or target_currency not in ("USD", "BTC"):
+        if source_currency not in _EXCHANGE_CURRENCIES or target_currency not in _EXCHANGE_CURRENCIES:
             return ExchangeResult.failed(
                 "INVALID_CURRENCY", "Strike only supports USD and BTC exchange"
             )
@@ -486,7 +577,7 @@ class StrikeWallet:
                 "amount": {"currency": source_currency, "amount": str(amount)},
             }
 
-            logger.info(f"Creating exchange: {amount} {source_currency} -> {target_currency}")
+            logger.info("Creating exchange: %s %s -> %s", amount, source_currency, target_currency)
 
             quote = await self._request("POST", "/currency-exchange-quotes", quote_request)
             quote_id = quote.get("id")
@@ -504,15 +595,15 @@ class StrikeWallet:
             fee = None
 
             if result.get("sourceAmount", {}).get("amount"):
-                source_amt = Decimal(str(result["sourceAmount"]["amount"]))
+                source_amt = _to_decimal(result["sourceAmount"]["amount"])
             if result.get("targetAmount", {}).get("amount"):
-                target_amt = Decimal(str(result["targetAmount"]["amount"]))
+                target_amt = _to_decimal(result["targetAmount"]["amount"])
             if result.get("fee", {}).get("amount"):
-                fee = Decimal(str(result["fee"]["amount"]))
+                fee = _to_decimal(result["fee"]["amount"])
 
             rate = target_amt / source_amt if source_amt > 0 else None
 
-            logger.info(f"Exchange completed: {source_amt} {source_currency} -> {target_amt} {target_currency}")
+            logger.info("Exchange completed: %s %s -> %s %s", source_amt, source_currency, target_amt, target_currency)
 
             return ExchangeResult.succeeded(
                 exchange_id=result.get("id", quote_id),
@@ -547,7 +638,7 @@ class StrikeWallet:
 
         try:
             # Convert sats to BTC
-            amount_btc = Decimal(amount_sats) / Decimal("100000000")
+            amount_btc = Decimal(amount_sats) / SATS_PER_BTC
 
             quote_request = {
                 "btcAddress": address,
@@ -555,7 +646,7 @@ class StrikeWallet:
                 "sourceAmount": {"currency": "BTC", "amount": str(amount_btc)},
             }
 
-            logger.info(f"Creating on-chain quote: {amount_sats} sats to {address}")
+            logger.info("Creating on-chain quote: %d sats to %s", amount_sats, address)
 
             quote = await self._request("POST", "/payment-quotes/onchain", quote_request)
             quote_id = quote.get("paymentQuoteId")
@@ -576,12 +667,12 @@ class StrikeWallet:
             # Get fee from quote
             fee_sats = 0
             if quote.get("onchainFee", {}).get("amount"):
-                fee_btc = Decimal(str(quote["onchainFee"]["amount"]))
+                fee_btc = _to_decimal(quote["onchainFee"]["amount"])
                 fee_currency = quote.get("onchainFee", {}).get("currency", "BTC")
                 if fee_currency.upper() == "BTC":
-                    fee_sats = int(fee_btc * 100_000_000)
+                    fee_sats = int(fee_btc * SATS_PER_BTC)
 
-            logger.info(f"On-chain payment: {payment_id}, state: {state}")
+            logger.info("On-chain payment: %s, state: %s", payment_id, state)
 
             return OnChainResult.succeeded(
                 payment_id=payment_id,
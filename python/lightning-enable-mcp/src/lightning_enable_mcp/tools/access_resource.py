@@ -5,8 +5,9 @@ Fetches URLs with automatic L402 payment handling.
 Uses the new BudgetService with multi-tier approval logic.
 """
 
-import json
 import logging
+from decimal import Decimal
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,11 +15,47 @@ if TYPE_CHECKING:
     from ..budget_service import BudgetService
     from ..l402_client import L402Client
 
+from .. import jsonutil
 from ..config import ApprovalLevel
 from . import sanitize_error
 
 logger = logging.getLogger("lightning-enable-mcp.tools.access")
 
+# Allowed HTTP methods — frozenset for O(1) membership without rebuilding a
+# literal tuple on every call.
+_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+
+@lru_cache(maxsize=256)
+def _denied_json(
+    url: str,
+    max_sats: int,
+    reason: str | None,
+    max_usd: Decimal,
+    remaining_usd: Decimal,
+) -> str:
+    """
+    Pre-serialized denial response.
+
+    Agent retry loops tend to hit the same denial repeatedly with identical
+    inputs; memoizing the serialized string skips the dict build and JSON
+    encode on every repeat. Decimal is hashable, so the USD amounts key the
+    cache directly with no precision loss (sat-scale payments are routinely
+    sub-cent).
+    """
+    return jsonutil.dumps({
+        "success": False,
+        "error": "Payment denied by budget policy",
+        "denialReason": reason,
+        "url": url,
+        "budget": {
+            "maxSats": max_sats,
+            "maxUsd": float(max_usd),
+            "remainingSessionUsd": float(remaining_usd),
+        },
+        "note": "Edit ~/.lightning-enable/config.json to change limits."
+    })
+
 
 async def access_l402_resource(
     url: str,
@@ -62,7 +99,7 @@ async def access_l402_resource(
     method = method.upper()
 
     # Validate method
-    if method not in ("GET", "POST", "PUT", "DELETE"):
+    if method not in _METHODS:
         return f"Error: Invalid HTTP method: {method}"
 
     try:
@@ -72,23 +109,18 @@ async def access_l402_resource(
             result = await budget_service.check_approval_level(max_sats)
 
             if result.level == ApprovalLevel.DENY:
-                return json.dumps({
-                    "success": False,
-                    "error": "Payment denied by budget policy",
-                    "denialReason": result.denial_reason,
-                    "url": url,
-                    "budget": {
-                        "maxSats": max_sats,
-                        "maxUsd": float(result.amount_usd),
-                        "remainingSessionUsd": float(result.remaining_session_budget_usd),
-                    },
-                    "note": "Edit ~/.lightning-enable/config.json to change limits."
-                })
+                return _denied_json(
+                    url,
+                    max_sats,
+                    result.denial_reason,
+                    result.amount_usd,
+                    result.remaining_session_budget_usd,
+                )
 
             # Check if payment requires confirmation (FORM_CONFIRM or URL_CONFIRM)
             if result.requires_confirmation and not confirmed:
                 url_display = url[:50] + "..." if len(url) > 50 else url
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": False,
                     "requiresConfirmation": True,
                     "approvalLevel": result.level.value,
@@ -107,13 +139,13 @@ async def access_l402_resource(
 
             # LOG_AND_APPROVE: Log for user awareness but proceed
             if result.level == ApprovalLevel.LOG_AND_APPROVE:
-                logger.info(f"Log-and-approve L402 request: up to {max_sats} sats (${result.amount_usd:.2f}) for {url[:50]}...")
+                logger.info("Log-and-approve L402 request: up to %d sats ($%.2f) for %s...", max_sats, result.amount_usd, url[:50])
 
         elif budget_manager:
             # Legacy budget manager fallback
             status = budget_manager.get_status()
             if status["remaining"] <= 0:
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": False,
                     "error": "Session budget exhausted",
                     "message": f"Spent {status['spent']}/{status['limits']['per_session']} sats. "
@@ -127,7 +159,7 @@ async def access_l402_resource(
                 # Estimate USD value (~$0.001 per sat at ~$100k/BTC)
                 estimated_usd = max_sats * 0.001
                 url_display = url[:50] + "..." if len(url) > 50 else url
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": False,
                     "requiresConfirmation": True,
                     "error": "L402 payment requires your confirmation",
@@ -157,17 +189,16 @@ async def access_l402_resource(
         # Record payment if one was made
         if amount_paid is not None:
             if budget_service:
-                budget_service.record_spend(amount_paid)
-                budget_service.record_payment_time()
-                logger.info(f"Paid {amount_paid} sats for L402 access to {url}")
+                budget_service.record_payment(amount_paid)
+                logger.info("Paid %d sats for L402 access to %s", amount_paid, url)
 
-                # Get updated session info
-                status = budget_service.get_status()
+                # Read session state directly — building the full get_status()
+                # tree just to pick out four fields is wasted work per request.
                 session_info = {
-                    "spentSats": status["session"]["spentSats"],
-                    "spentUsd": status["session"]["spentUsd"],
-                    "remainingUsd": status["session"]["remainingUsd"],
-                    "requestCount": status["session"]["requestCount"],
+                    "spentSats": budget_service.session_spent_sats,
+                    "spentUsd": float(budget_service.session_spent_usd),
+                    "remainingUsd": float(budget_service.remaining_session_budget_usd),
+                    "requestCount": budget_service.request_count,
                 }
             elif budget_manager:
                 budget_manager.record_payment(
@@ -177,7 +208,7 @@ async def access_l402_resource(
                     preimage="(auto-paid)",
                     status="success",
                 )
-                logger.info(f"Paid {amount_paid} sats for L402 access to {url}")
+                logger.info("Paid %d sats for L402 access to %s", amount_paid, url)
                 session_info = {
                     "spentSats": budget_manager.session_spent,
                     "remainingSats": budget_manager.max_per_session - budget_manager.session_spent,
@@ -202,7 +233,7 @@ async def access_l402_resource(
         if session_info:
             result["session"] = session_info
 
-        return json.dumps(result, indent=2)
+        return jsonutil.dumps(result, indent=True)
 
     except Exception as e:
         logger.exception(f"Error accessing {url}")
@@ -214,4 +245,4 @@ async def access_l402_resource(
             "error": sanitize_error(str(e)),
         }
 
-        return json.dumps(error_result, indent=2)
+        return jsonutil.dumps(error_result, indent=True)
@@ -4,8 +4,9 @@ Budget Tools
 Configure spending limits and view payment history.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
@@ -33,24 +34,24 @@ async def configure_budget(
         JSON with confirmation of limits set
     """
     if not budget_manager:
-        return json.dumps(
+        return jsonutil.dumps(
             {"success": False, "error": "Budget manager not initialized"}
         )
 
     try:
         # Validate inputs
         if per_request <= 0:
-            return json.dumps(
+            return jsonutil.dumps(
                 {"success": False, "error": "per_request must be positive"}
             )
 
         if per_session <= 0:
-            return json.dumps(
+            return jsonutil.dumps(
                 {"success": False, "error": "per_session must be positive"}
             )
 
         if per_request > per_session:
-            return json.dumps(
+            return jsonutil.dumps(
                 {
                     "success": False,
                     "error": "per_request cannot exceed per_session",
@@ -78,17 +79,17 @@ async def configure_budget(
                 "payment_count": status["payment_count"],
             },
             "message": (
-                f"Budget configured: {limits.per_request} sats per request, "
-                f"{limits.per_session} sats per session. "
-                f"Remaining: {status['remaining']} sats."
+                "Budget configured: %d sats per request, %d sats per session. "
+                "Remaining: %d sats."
+                % (limits.per_request, limits.per_session, status["remaining"])
             ),
         }
 
-        return json.dumps(result, indent=2)
+        return jsonutil.dumps(result, indent=True)
 
     except Exception as e:
         logger.exception("Error configuring budget")
-        return json.dumps({"success": False, "error": sanitize_error(str(e))})
+        return jsonutil.dumps({"success": False, "error": sanitize_error(str(e))})
 
 
 async def get_payment_history(
@@ -108,7 +109,7 @@ async def get_payment_history(
         JSON with list of payments
     """
     if not budget_manager:
-        return json.dumps(
+        return jsonutil.dumps(
             {"success": False, "error": "Budget manager not initialized"}
         )
 
@@ -117,9 +118,14 @@ async def get_payment_history(
         since_dt = None
         if since:
             try:
-                since_dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
+                # Python 3.11+ parses a trailing "Z" directly; only fall
+                # back to the allocating Z -> +00:00 rewrite on 3.10.
+                try:
+                    since_dt = datetime.fromisoformat(since)
+                except ValueError:
+                    since_dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
             except ValueError:
-                return json.dumps(
+                return jsonutil.dumps(
                     {
                         "success": False,
                         "error": f"Invalid timestamp format: {since}. Use ISO format.",
@@ -153,8 +159,8 @@ async def get_payment_history(
         else:
             result["message"] = "No payments recorded in this session."
 
-        return json.dumps(result, indent=2)
+        return jsonutil.dumps(result, indent=True)
 
     except Exception as e:
         logger.exception("Error getting payment history")
-        return json.dumps({"success": False, "error": sanitize_error(str(e))})
+        return jsonutil.dumps({"success": False, "error": sanitize_error(str(e))})
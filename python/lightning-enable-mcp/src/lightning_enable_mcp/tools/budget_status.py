@@ -5,8 +5,9 @@ Get current budget status from the BudgetService (read-only).
 Uses the new multi-tier approval system with USD-based limits.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("lightning-enable-mcp.tools.budget_status")
 
+# Last serialized status, keyed on everything that can change the output:
+# the service instance, its session counters and cooldown state, the loaded
+# configuration object (replaced when the config file is reloaded), and the
+# price snapshot (replaced on each refresh). Clients poll this tool, so
+# repeat polls with no activity skip the dict build and JSON encode.
+_status_cache: "tuple[tuple, str] | None" = None
+
 
 async def get_budget_status(
     budget_service: "BudgetService | None" = None,
@@ -41,7 +49,7 @@ async def get_budget_status(
             from ..budget_service import get_budget_service
             budget_service = get_budget_service()
         except Exception as e:
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": f"Budget service not initialized: {e}",
                 "hint": "Budget service is initialized on first use. Try making a payment first."
@@ -63,16 +71,39 @@ async def get_budget_status(
         price_error = sanitize_error(str(ex))
 
     try:
+        global _status_cache
+
+        key = None
+        if price_error is None:
+            try:
+                from ..price_service import get_price_service
+                key = (
+                    budget_service,
+                    budget_service.session_spent_sats,
+                    budget_service.request_count,
+                    budget_service.cooldown_active,
+                    budget_service.get_user_configuration(),
+                    get_price_service().get_last_snapshot(),
+                )
+                if _status_cache is not None and _status_cache[0] == key:
+                    return _status_cache[1]
+            except Exception:  # pragma: no cover - cache is best-effort
+                key = None
+
         status = budget_service.get_status()
         if price_error and isinstance(status.get("price"), dict):
             status["price"]["error"] = price_error
-        return json.dumps({
+        payload = jsonutil.dumps({
             "success": True,
             **status,
-        }, indent=2)
+        }, indent=True)
+
+        if key is not None:
+            _status_cache = (key, payload)
+        return payload
     except Exception as e:
         logger.exception("Error getting budget status")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -4,8 +4,9 @@ Check Invoice Status Tool
 Check the payment status of a previously created Lightning invoice.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING, Union
 
@@ -36,13 +37,13 @@ async def check_invoice_status(
         JSON with invoice status including whether it has been paid
     """
     if not invoice_id or not invoice_id.strip():
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Invoice ID is required"
         })
 
     if not wallet:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Wallet not configured. Set LND_REST_HOST+LND_MACAROON_HEX, STRIKE_API_KEY, OPENNODE_API_KEY, or NWC_CONNECTION_STRING environment variable."
         })
@@ -62,7 +63,7 @@ async def check_invoice_status(
             else:
                 message = f"Invoice {invoice_id} status: {status['state']}"
 
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": True,
                 "provider": "LND",
                 "invoice": {
@@ -74,7 +75,7 @@ async def check_invoice_status(
                     "settledAt": status.get("settled_at"),
                 },
                 "message": message,
-            }, indent=2)
+            }, indent=True)
 
         elif isinstance(wallet, StrikeWallet):
             # Use Strike API to check invoice status
@@ -94,7 +95,7 @@ async def check_invoice_status(
             else:
                 message = f"Invoice {invoice_id} status: {state}"
 
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": True,
                 "provider": "Strike",
                 "invoice": {
@@ -106,10 +107,10 @@ async def check_invoice_status(
                     "paidAt": paid_at,
                 },
                 "message": message,
-            }, indent=2)
+            }, indent=True)
         else:
             provider_name = type(wallet).__name__.replace("Wallet", "")
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": f"Invoice status check is not supported with {provider_name} wallet.",
                 "hint": "Use LND (set LND_REST_HOST+LND_MACAROON_HEX) or Strike (set STRIKE_API_KEY) for invoice status checking."
@@ -117,7 +118,7 @@ async def check_invoice_status(
 
     except Exception as e:
         logger.exception("Error checking invoice status")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -6,8 +6,9 @@ This is a separate tool call that appears as a distinct action in Claude Code,
 ensuring the user sees and can approve/deny the confirmation.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING
 
@@ -35,13 +36,13 @@ async def confirm_payment(
         JSON with confirmation result or error message
     """
     if not nonce or not nonce.strip():
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Nonce is required"
         })
 
     if not budget_service:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Budget service not available"
         })
@@ -50,14 +51,14 @@ async def confirm_payment(
         confirmation = budget_service.validate_confirmation(nonce.strip().upper())
 
         if confirmation is None:
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": "Invalid, expired, or already-used confirmation nonce",
                 "message": "The nonce may have expired (2 minute limit) or was already used. "
                            "Request a new confirmation by calling the original payment tool again."
             })
 
-        return json.dumps({
+        return jsonutil.dumps({
             "success": True,
             "confirmed": True,
             "message": f"Payment of ${confirmation.get('amount_usd', 0):.2f} "
@@ -69,18 +70,18 @@ async def confirm_payment(
                 "toolName": confirmation.get("tool_name"),
                 "description": confirmation.get("description"),
             }
-        }, indent=2)
+        }, indent=True)
 
     except AttributeError:
         # validate_confirmation may not exist on all BudgetService versions
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Confirmation validation not supported by current budget service version",
             "hint": "Upgrade the MCP server to support payment confirmations."
         })
     except Exception as e:
         logger.exception("Error confirming payment")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -5,8 +5,9 @@ Create a Lightning invoice to receive a payment.
 Returns a BOLT11 invoice string to share with the payer.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING, Union
 
@@ -41,13 +42,13 @@ async def create_invoice(
         JSON with invoice details including BOLT11 string to share with payer
     """
     if amount_sats <= 0:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Amount must be greater than 0 sats"
         })
 
     if not wallet:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Wallet not configured. Set LND_REST_HOST+LND_MACAROON_HEX, STRIKE_API_KEY, OPENNODE_API_KEY, or NWC_CONNECTION_STRING environment variable."
         })
@@ -65,7 +66,7 @@ async def create_invoice(
                 expiry_secs=expiry_secs,
             )
 
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": True,
                 "provider": "LND",
                 "invoice": {
@@ -74,7 +75,7 @@ async def create_invoice(
                     "amountSats": inv_result["amount_sats"],
                 },
                 "message": f"Invoice created for {amount_sats} sats. Share the bolt11 string with the payer."
-            }, indent=2)
+            }, indent=True)
 
         elif isinstance(wallet, StrikeWallet):
             # Create invoice via Strike API
@@ -94,7 +95,7 @@ async def create_invoice(
             invoice_id = result.get("invoiceId")
             bolt11 = result.get("quote") or result.get("lnInvoice")
 
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": True,
                 "provider": "Strike",
                 "invoice": {
@@ -104,7 +105,7 @@ async def create_invoice(
                     "expiresAt": result.get("expiresAt"),
                 },
                 "message": f"Invoice created for {amount_sats} sats. Share the bolt11 string with the payer."
-            }, indent=2)
+            }, indent=True)
 
         elif isinstance(wallet, OpenNodeWallet):
             # Create charge via OpenNode API
@@ -119,7 +120,7 @@ async def create_invoice(
             charge_id = result.get("id")
             bolt11 = (result.get("lightning_invoice") or {}).get("payreq") or result.get("lightning_invoice")
 
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": True,
                 "provider": "OpenNode",
                 "invoice": {
@@ -128,7 +129,7 @@ async def create_invoice(
                     "amountSats": amount_sats,
                 },
                 "message": f"Invoice created for {amount_sats} sats. Share the bolt11 string with the payer."
-            }, indent=2)
+            }, indent=True)
 
         else:
             # NWC - try make_invoice NIP-47 method
@@ -144,13 +145,13 @@ async def create_invoice(
 
                 if response.get("error"):
                     error = response["error"]
-                    return json.dumps({
+                    return jsonutil.dumps({
                         "success": False,
                         "error": f"Failed to create invoice: {error.get('message', error)}"
                     })
 
                 result = response.get("result", {})
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": True,
                     "provider": "NWC",
                     "invoice": {
@@ -159,10 +160,10 @@ async def create_invoice(
                         "amountSats": amount_sats,
                     },
                     "message": f"Invoice created for {amount_sats} sats. Share the bolt11 string with the payer."
-                }, indent=2)
+                }, indent=True)
 
             except Exception as e:
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": False,
                     "error": f"Invoice creation failed: {sanitize_error(str(e))}",
                     "hint": "Not all NWC wallets support invoice creation."
@@ -170,7 +171,7 @@ async def create_invoice(
 
     except Exception as e:
         logger.exception("Error creating invoice")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -6,8 +6,9 @@ This is the "producer" side of L402 — merchants create challenges, payers pay
 Requires LIGHTNING_ENABLE_API_KEY with an Agentic Commerce subscription.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING
 
@@ -40,25 +41,25 @@ async def create_l402_challenge(
     """
     # Input validation
     if not resource or not resource.strip():
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Resource identifier is required. Provide a URL, service name, or description of what you're charging for."
         })
 
     if price_sats <= 0:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Price must be greater than 0 sats"
         })
 
     if api_client is None:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Lightning Enable API service not available"
         })
 
     if not api_client.is_configured:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Lightning Enable API key not configured. "
                      "Set LIGHTNING_ENABLE_API_KEY environment variable or add 'lightningEnableApiKey' to ~/.lightning-enable/config.json. "
@@ -69,7 +70,7 @@ async def create_l402_challenge(
         result = await api_client.create_challenge(resource, price_sats, description)
 
         if not result.get("success"):
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": result.get("error", "Unknown error creating challenge")
             })
@@ -77,7 +78,7 @@ async def create_l402_challenge(
         challenge = result.get("challenge", {})
         macaroon = challenge.get("macaroon", "")
 
-        return json.dumps({
+        return jsonutil.dumps({
             "success": True,
             "challenge": {
                 "invoice": challenge.get("invoice"),
@@ -94,11 +95,11 @@ async def create_l402_challenge(
                 "verifyWith": "After receiving the L402 token from the payer, use verify_l402_payment to confirm payment before granting access."
             },
             "message": f"L402 challenge created for {price_sats} sats. Share the invoice with the payer."
-        }, indent=2)
+        }, indent=True)
 
     except Exception as e:
         logger.exception("Error creating L402 challenge")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
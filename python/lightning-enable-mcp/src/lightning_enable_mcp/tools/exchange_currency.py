@@ -5,8 +5,9 @@ Exchange currency within your wallet (USD to BTC or BTC to USD).
 Currently only available with Strike wallet.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from decimal import Decimal
 from typing import TYPE_CHECKING, Union
@@ -16,6 +17,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("lightning-enable-mcp.tools.exchange_currency")
 
+# Static error responses serialized once at import — these branches carry no
+# per-call data, so re-serializing them on every call buys nothing.
+_ERR_SOURCE_REQUIRED = jsonutil.dumps({
+    "success": False,
+    "error": "Source currency is required (USD or BTC)"
+})
+_ERR_TARGET_REQUIRED = jsonutil.dumps({
+    "success": False,
+    "error": "Target currency is required (BTC or USD)"
+})
+_ERR_INVALID_AMOUNT = jsonutil.dumps({
+    "success": False,
+    "error": "Amount must be greater than 0"
+})
+_ERR_NO_WALLET = jsonutil.dumps({
+    "success": False,
+    "error": "Currency exchange requires Strike wallet. Set STRIKE_API_KEY environment variable."
+})
+
 
 async def exchange_currency(
     source_currency: str,
@@ -39,34 +59,22 @@ async def exchange_currency(
         JSON with exchange result or error message
     """
     if not source_currency or not source_currency.strip():
-        return json.dumps({
-            "success": False,
-            "error": "Source currency is required (USD or BTC)"
-        })
+        return _ERR_SOURCE_REQUIRED
 
     if not target_currency or not target_currency.strip():
-        return json.dumps({
-            "success": False,
-            "error": "Target currency is required (BTC or USD)"
-        })
+        return _ERR_TARGET_REQUIRED
 
     if amount <= 0:
-        return json.dumps({
-            "success": False,
-            "error": "Amount must be greater than 0"
-        })
+        return _ERR_INVALID_AMOUNT
 
     if not wallet:
-        return json.dumps({
-            "success": False,
-            "error": "Currency exchange requires Strike wallet. Set STRIKE_API_KEY environment variable."
-        })
+        return _ERR_NO_WALLET
 
     # Verify it's a Strike wallet
     from ..strike_wallet import StrikeWallet
     if not isinstance(wallet, StrikeWallet):
         provider_name = type(wallet).__name__.replace("Wallet", "")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": f"{provider_name} does not support currency exchange. Use Strike wallet.",
             "errorCode": "NOT_SUPPORTED",
@@ -81,7 +89,7 @@ async def exchange_currency(
         )
 
         if not result.success:
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": result.error_message,
                 "errorCode": result.error_code,
@@ -98,7 +106,7 @@ async def exchange_currency(
         else:
             target_formatted = f"${result.target_amount:,.2f} USD"
 
-        return json.dumps({
+        return jsonutil.dumps({
             "success": True,
             "provider": "Strike",
             "exchange": {
@@ -112,11 +120,11 @@ async def exchange_currency(
                 "state": result.state,
             },
             "message": f"Exchanged {source_formatted} for {target_formatted}"
-        }, indent=2)
+        }, indent=True)
 
     except Exception as e:
         logger.exception("Error exchanging currency")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -5,8 +5,9 @@ Get all currency balances from your wallet (USD, BTC, etc.).
 Most useful with Strike wallet which supports multiple currencies.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING, Union
 
@@ -18,6 +19,13 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("lightning-enable-mcp.tools.get_all_balances")
 
+# Static error response serialized once at import.
+_ERR_NO_WALLET = jsonutil.dumps({
+    "success": False,
+    "error": "Wallet not configured. Set STRIKE_API_KEY, OPENNODE_API_KEY, or NWC_CONNECTION_STRING environment variable.",
+    "configured": False,
+})
+
 
 async def get_all_balances(
     wallet: "Union[NWCWallet, OpenNodeWallet, StrikeWallet, None]" = None,
@@ -50,7 +58,7 @@ async def get_all_balances(
             result = await effective_strike.get_all_balances()
 
             if not result.success:
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": False,
                     "error": result.error_message,
                     "errorCode": result.error_code,
@@ -91,11 +99,11 @@ async def get_all_balances(
                 except Exception:
                     pass
 
-            return json.dumps(response, indent=2)
+            return jsonutil.dumps(response, indent=True)
 
         except Exception as e:
             logger.exception("Error getting all balances from Strike")
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": sanitize_error(str(e))
             })
@@ -132,17 +140,13 @@ async def get_all_balances(
                 except Exception:
                     pass
 
-            return json.dumps(response, indent=2)
+            return jsonutil.dumps(response, indent=True)
 
         except Exception as e:
             logger.exception("Error getting balance")
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": sanitize_error(str(e))
             })
 
-    return json.dumps({
-        "success": False,
-        "error": "Wallet not configured. Set STRIKE_API_KEY, OPENNODE_API_KEY, or NWC_CONNECTION_STRING environment variable.",
-        "configured": False,
-    })
+    return _ERR_NO_WALLET
@@ -5,8 +5,9 @@ Get the current Bitcoin price in USD.
 Only available with Strike wallet.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING
 
@@ -15,6 +16,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("lightning-enable-mcp.tools.get_btc_price")
 
+# Static error response serialized once at import.
+_ERR_NO_WALLET = jsonutil.dumps({
+    "success": False,
+    "error": "Wallet not configured. Set STRIKE_API_KEY environment variable for price data."
+})
+
 
 async def get_btc_price(
     wallet: "StrikeWallet | None" = None,
@@ -32,16 +39,13 @@ async def get_btc_price(
         JSON with current BTC price in USD
     """
     if not wallet:
-        return json.dumps({
-            "success": False,
-            "error": "Wallet not configured. Set STRIKE_API_KEY environment variable for price data."
-        })
+        return _ERR_NO_WALLET
 
     # Verify it's a Strike wallet
     from ..strike_wallet import StrikeWallet
     if not isinstance(wallet, StrikeWallet):
         provider_name = type(wallet).__name__.replace("Wallet", "")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": f"Price ticker is only available with Strike wallet. Current wallet: {provider_name}",
             "errorCode": "NOT_SUPPORTED",
@@ -52,24 +56,24 @@ async def get_btc_price(
         result = await wallet.get_btc_price()
 
         if not result.success:
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": result.error_message,
                 "errorCode": result.error_code,
             })
 
-        return json.dumps({
+        return jsonutil.dumps({
             "success": True,
             "provider": "Strike",
             "ticker": {
                 "btcUsd": float(result.btc_usd_price),
             },
             "message": f"Current BTC price: ${result.btc_usd_price:,.2f} USD"
-        }, indent=2)
+        }, indent=True)
 
     except Exception as e:
         logger.exception("Error getting BTC price")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -5,8 +5,9 @@ Pay a Lightning invoice directly and get the preimage as proof of payment.
 Uses the new BudgetService with multi-tier approval logic.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from typing import TYPE_CHECKING, Union
 
 if TYPE_CHECKING:
@@ -16,10 +17,48 @@ if TYPE_CHECKING:
     from ..opennode_wallet import OpenNodeWallet
 
 from ..config import ApprovalLevel
+from ..exceptions import WalletError
 from . import sanitize_error
 
 logger = logging.getLogger("lightning-enable-mcp.tools.pay_invoice")
 
+# Static error responses serialized once at import — these branches carry no
+# per-call data, so re-serializing them on every call buys nothing.
+_ERR_NO_INVOICE = jsonutil.dumps({
+    "success": False,
+    "error": "Invoice is required"
+})
+_ERR_INVALID_FORMAT = jsonutil.dumps({
+    "success": False,
+    "error": "Invalid invoice format. Must be a BOLT11 invoice starting with 'lnbc' (mainnet) or 'lntb' (testnet)"
+})
+_ERR_NO_WALLET = jsonutil.dumps({
+    "success": False,
+    "error": "Wallet not configured. Set NWC_CONNECTION_STRING or OPENNODE_API_KEY environment variable."
+})
+_ERR_NO_PREIMAGE = jsonutil.dumps({
+    "success": False,
+    "error": "Payment failed - no preimage returned"
+})
+
+# Static skeleton for denial responses; per-call branches copy it and fill
+# in only the varying fields instead of rebuilding every literal each time.
+_DENY_TMPL = {
+    "success": False,
+    "error": "Payment denied by budget policy",
+    "note": "Edit ~/.lightning-enable/config.json to change limits.",
+}
+
+
+def _normalize_invoice(invoice: str) -> str:
+    """Strip and lowercase an invoice in at most one copy per step.
+
+    BOLT11 invoices can exceed 700 chars, so the lowercase copy is skipped
+    when the stripped string is already lowercase (the common case).
+    """
+    stripped = invoice.strip()
+    return stripped if stripped.islower() else stripped.lower()
+
 
 async def pay_invoice(
     invoice: str,
@@ -51,29 +90,21 @@ async def pay_invoice(
     Returns:
         JSON with payment result including preimage or error message
     """
-    # Validate invoice is provided
-    if not invoice or not invoice.strip():
-        return json.dumps({
-            "success": False,
-            "error": "Invoice is required"
-        })
+    # Validate invoice is provided; normalize once so later branches reuse
+    # the same string instead of re-stripping.
+    normalized_invoice = _normalize_invoice(invoice) if invoice else ""
+    if not normalized_invoice:
+        return _ERR_NO_INVOICE
 
     if not wallet:
-        return json.dumps({
-            "success": False,
-            "error": "Wallet not configured. Set NWC_CONNECTION_STRING or OPENNODE_API_KEY environment variable."
-        })
+        return _ERR_NO_WALLET
 
     try:
-        # Normalize invoice to lowercase
-        normalized_invoice = invoice.strip().lower()
-
-        # Basic validation - must be a BOLT11 invoice
-        if not normalized_invoice.startswith("lnbc") and not normalized_invoice.startswith("lntb"):
-            return json.dumps({
-                "success": False,
-                "error": "Invalid invoice format. Must be a BOLT11 invoice starting with 'lnbc' (mainnet) or 'lntb' (testnet)"
-            })
+        # Basic validation - must be a BOLT11 invoice. startswith with a
+        # tuple does the whole prefix check in one C-level call. "lnbc"
+        # also matches regtest (lnbcrt) and "lntb" matches signet (lntbs).
+        if not normalized_invoice.startswith(("lnbc", "lntb")):
+            return _ERR_INVALID_FORMAT
 
         # Use new BudgetService if available, otherwise fall back to legacy BudgetManager
         if budget_service:
@@ -81,21 +112,20 @@ async def pay_invoice(
             result = await budget_service.check_approval_level(max_sats)
 
             if result.level == ApprovalLevel.DENY:
-                return json.dumps({
-                    "success": False,
-                    "error": "Payment denied by budget policy",
-                    "denialReason": result.denial_reason,
-                    "budget": {
-                        "requestedSats": max_sats,
-                        "requestedUsd": float(result.amount_usd),
-                        "remainingSessionUsd": float(result.remaining_session_budget_usd),
-                    },
-                    "note": "Edit ~/.lightning-enable/config.json to change limits."
-                })
+                denial = _DENY_TMPL.copy()
+                denial["denialReason"] = result.denial_reason
+                denial["budget"] = {
+                    "requestedSats": max_sats,
+                    # Decimals pass through; jsonutil converts them once
+                    # at encode time instead of eagerly here.
+                    "requestedUsd": result.amount_usd,
+                    "remainingSessionUsd": result.remaining_session_budget_usd,
+                }
+                return jsonutil.dumps(denial)
 
             # Check if payment requires confirmation (FORM_CONFIRM or URL_CONFIRM)
             if result.requires_confirmation and not confirmed:
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": False,
                     "requiresConfirmation": True,
                     "approvalLevel": result.level.value,
@@ -104,25 +134,24 @@ async def pay_invoice(
                     "howToConfirm": 'Call: pay_invoice(invoice="...", confirmed=True)',
                     "amount": {
                         "sats": max_sats,
-                        "usd": float(result.amount_usd)
+                        "usd": result.amount_usd
                     },
                     "budget": {
-                        "remainingSessionUsd": float(result.remaining_session_budget_usd),
+                        "remainingSessionUsd": result.remaining_session_budget_usd,
                     }
                 })
 
             # LOG_AND_APPROVE: Log for user awareness but proceed
             if result.level == ApprovalLevel.LOG_AND_APPROVE:
-                logger.info(f"Log-and-approve payment: {max_sats} sats (${result.amount_usd:.2f})")
+                logger.info("Log-and-approve payment: %d sats ($%.2f)", max_sats, result.amount_usd)
 
         elif budget_manager:
             # Legacy budget manager fallback
-            try:
-                budget_manager.check_payment(max_sats)
-            except Exception as e:
-                return json.dumps({
+            ok, reason = budget_manager.try_check_payment(max_sats)
+            if not ok:
+                return jsonutil.dumps({
                     "success": False,
-                    "error": sanitize_error(str(e)),
+                    "error": sanitize_error(reason),
                     "budget": {
                         "requested_sats": max_sats,
                         "remaining_sats": budget_manager.max_per_session - budget_manager.session_spent
@@ -134,7 +163,7 @@ async def pay_invoice(
             if max_sats > auto_approve_sats and not confirmed:
                 # Estimate USD value (~$0.001 per sat at ~$100k/BTC)
                 estimated_usd = max_sats * 0.001
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": False,
                     "requiresConfirmation": True,
                     "error": "Payment requires your confirmation",
@@ -152,7 +181,7 @@ async def pay_invoice(
                 })
 
         # Pay the invoice
-        logger.info(f"Paying invoice: {normalized_invoice[:30]}...")
+        logger.info("Paying invoice: %.30s...", normalized_invoice)
         preimage = await wallet.pay_invoice(normalized_invoice)
 
         if not preimage:
@@ -165,15 +194,11 @@ async def pay_invoice(
                     preimage="",
                     status="failed",
                 )
-            return json.dumps({
-                "success": False,
-                "error": "Payment failed - no preimage returned"
-            })
+            return _ERR_NO_PREIMAGE
 
         # Record the payment
         if budget_service:
-            budget_service.record_spend(max_sats)
-            budget_service.record_payment_time()
+            budget_service.record_payment(max_sats)
 
             # Get updated session info
             status = budget_service.get_status()
@@ -198,20 +223,44 @@ async def pay_invoice(
         else:
             session_info = None
 
-        # Return success with preimage
+        # Return success with preimage. Truncate the invoice once, up front,
+        # so the response dict gets the final string directly.
+        if len(normalized_invoice) > 30:
+            shown_invoice = f"{normalized_invoice[:30]}..."
+        else:
+            shown_invoice = normalized_invoice
         response = {
             "success": True,
             "preimage": preimage,
             "message": "Payment successful",
             "invoice": {
-                "paid": normalized_invoice[:30] + "..." if len(normalized_invoice) > 30 else normalized_invoice
+                "paid": shown_invoice
             }
         }
 
         if session_info:
             response["session"] = session_info
 
-        return json.dumps(response, indent=2)
+        return jsonutil.dumps(response, indent=jsonutil.PRETTY)
+
+    except WalletError as e:
+        # Known wallet failure: the message is already user-appropriate and
+        # a full traceback adds nothing, so log without one.
+        logger.warning("Wallet error paying invoice: %s", e)
+
+        if budget_manager:
+            budget_manager.record_payment(
+                url="direct-invoice",
+                amount_sats=0,
+                invoice=invoice,
+                preimage="",
+                status="failed",
+            )
+
+        return jsonutil.dumps({
+            "success": False,
+            "error": sanitize_error(str(e))
+        })
 
     except Exception as e:
         logger.exception("Error paying invoice")
@@ -226,7 +275,7 @@ async def pay_invoice(
                 status="failed",
             )
 
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -5,8 +5,9 @@ Send an on-chain Bitcoin payment to a Bitcoin address.
 Supports Strike and LND wallets.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING, Union
 
@@ -17,6 +18,21 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("lightning-enable-mcp.tools.send_onchain")
 
+# Static error responses serialized once at import — these branches carry no
+# per-call data, so re-serializing them on every call buys nothing.
+_ERR_ADDRESS_REQUIRED = jsonutil.dumps({
+    "success": False,
+    "error": "Bitcoin address is required"
+})
+_ERR_INVALID_AMOUNT = jsonutil.dumps({
+    "success": False,
+    "error": "Amount must be greater than 0 sats"
+})
+_ERR_NO_WALLET = jsonutil.dumps({
+    "success": False,
+    "error": "Wallet not configured. Set STRIKE_API_KEY or LND_REST_HOST+LND_MACAROON_HEX for on-chain payments."
+})
+
 
 async def send_onchain(
     address: str,
@@ -40,29 +56,20 @@ async def send_onchain(
         JSON with payment result including transaction details
     """
     if not address or not address.strip():
-        return json.dumps({
-            "success": False,
-            "error": "Bitcoin address is required"
-        })
+        return _ERR_ADDRESS_REQUIRED
 
     if amount_sats <= 0:
-        return json.dumps({
-            "success": False,
-            "error": "Amount must be greater than 0 sats"
-        })
+        return _ERR_INVALID_AMOUNT
 
     if not wallet:
-        return json.dumps({
-            "success": False,
-            "error": "Wallet not configured. Set STRIKE_API_KEY or LND_REST_HOST+LND_MACAROON_HEX for on-chain payments."
-        })
+        return _ERR_NO_WALLET
 
     # Verify it's a supported wallet type
     from ..strike_wallet import StrikeWallet
     from ..lnd_wallet import LndWallet
     if not isinstance(wallet, (StrikeWallet, LndWallet)):
         provider_name = type(wallet).__name__.replace("Wallet", "")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": f"{provider_name} does not support on-chain payments. Use Strike or LND wallet.",
             "errorCode": "NOT_SUPPORTED",
@@ -75,7 +82,7 @@ async def send_onchain(
             budget_result = await budget_service.check_approval_level(amount_sats)
             from ..config import ApprovalLevel
             if budget_result.level == ApprovalLevel.DENY:
-                return json.dumps({
+                return jsonutil.dumps({
                     "success": False,
                     "error": f"Budget check failed: {budget_result.denial_reason}",
                 })
@@ -86,7 +93,7 @@ async def send_onchain(
         result = await wallet.send_onchain(address.strip(), amount_sats)
 
         if not result.success:
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": result.error_message,
                 "errorCode": result.error_code,
@@ -96,8 +103,7 @@ async def send_onchain(
         if budget_service:
             try:
                 total_sats = amount_sats + (result.fee_sats or 0)
-                budget_service.record_spend(total_sats)
-                budget_service.record_payment_time()
+                budget_service.record_payment(total_sats)
             except Exception:
                 pass
 
@@ -108,7 +114,7 @@ async def send_onchain(
         else:
             message = f"On-chain payment initiated (status: {result.state})"
 
-        return json.dumps({
+        return jsonutil.dumps({
             "success": True,
             "provider": provider_name,
             "payment": {
@@ -119,11 +125,11 @@ async def send_onchain(
                 "feeSats": result.fee_sats,
             },
             "message": message,
-        }, indent=2)
+        }, indent=True)
 
     except Exception as e:
         logger.exception("Error sending on-chain payment")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -6,8 +6,9 @@ This is the "producer" side — verify that the payer has actually paid before g
 Requires LIGHTNING_ENABLE_API_KEY with an Agentic Commerce subscription.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING
 
@@ -38,25 +39,25 @@ async def verify_l402_payment(
     """
     # Input validation
     if not macaroon or not macaroon.strip():
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Macaroon is required. This is the base64-encoded macaroon from the L402 token."
         })
 
     if not preimage or not preimage.strip():
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Preimage is required. This is the hex-encoded proof of payment from the L402 token."
         })
 
     if api_client is None:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Lightning Enable API service not available"
         })
 
     if not api_client.is_configured:
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": "Lightning Enable API key not configured. "
                      "Set LIGHTNING_ENABLE_API_KEY environment variable or add 'lightningEnableApiKey' to ~/.lightning-enable/config.json. "
@@ -67,20 +68,20 @@ async def verify_l402_payment(
         result = await api_client.verify_token(macaroon.strip(), preimage.strip())
 
         if not result.get("success"):
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": False,
                 "error": result.get("error", "Unknown error verifying token")
             })
 
         if result.get("valid"):
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": True,
                 "valid": True,
                 "resource": result.get("resource"),
                 "message": "Payment verified. The payer has paid — you can now grant access to the resource."
             })
         else:
-            return json.dumps({
+            return jsonutil.dumps({
                 "success": True,
                 "valid": False,
                 "message": "Payment verification failed. The token is invalid or the invoice has not been paid. Do NOT grant access."
@@ -88,7 +89,7 @@ async def verify_l402_payment(
 
     except Exception as e:
         logger.exception("Error verifying L402 payment")
-        return json.dumps({
+        return jsonutil.dumps({
             "success": False,
             "error": sanitize_error(str(e))
         })
@@ -4,8 +4,9 @@ Wallet Tools
 Check wallet balance and status via NWC.
 """
 
-import json
 import logging
+
+from .. import jsonutil
 from . import sanitize_error
 from typing import TYPE_CHECKING
 
@@ -25,7 +26,7 @@ async def check_wallet_balance(
         JSON with balance information or error message
     """
     if not wallet:
-        return json.dumps(
+        return jsonutil.dumps(
             {"success": False, "error": "Wallet not initialized. Check NWC connection."}
         )
 
@@ -53,8 +54,8 @@ async def check_wallet_balance(
             # get_info might not be supported by all wallets
             pass
 
-        return json.dumps(result, indent=2)
+        return jsonutil.dumps(result, indent=True)
 
     except Exception as e:
         logger.exception("Error checking wallet balance")
-        return json.dumps({"success": False, "error": sanitize_error(str(e))})
+        return jsonutil.dumps({"success": False, "error": sanitize_error(str(e))})
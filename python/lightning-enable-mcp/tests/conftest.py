@@ -0,0 +1,19 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+
+@pytest.fixture
+def mock_wallet():
+    """AsyncMock wallet whose pay_invoice succeeds with a fixed preimage.
+
+    Function-scoped so call counts and side effects never bleed between
+    tests; individual tests override return_value/side_effect as needed
+    instead of hand-building a fresh AsyncMock each time.
+    """
+    wallet = AsyncMock()
+    wallet.pay_invoice = AsyncMock(return_value="preimage")
+    return wallet
@@ -61,6 +61,16 @@ class TestBudgetManager:
         with pytest.raises(BudgetExceededError):
             manager.check_payment(600, max_override=500)
 
+    def test_can_spend(self):
+        """Test the boolean budget check mirrors check_payment."""
+        manager = BudgetManager(max_per_request=1000, max_per_session=1000)
+        manager.session_spent = 800
+
+        assert manager.can_spend(200) is True
+        assert manager.can_spend(500) is False  # exceeds remaining session
+        assert manager.can_spend(1500) is False  # exceeds per-request
+        assert manager.can_spend(200, max_override=100) is False
+
     def test_record_payment(self):
         """Test recording a payment."""
         manager = BudgetManager()
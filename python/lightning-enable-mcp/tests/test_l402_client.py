@@ -4,8 +4,10 @@ Tests for L402 Client
 
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 from lightning_enable_mcp.l402_client import (
+    MAX_RESPONSE_BYTES,
     L402Client,
     L402Challenge,
     L402Token,
@@ -280,3 +282,141 @@ class TestPayChallengeNoAmountRejection:
                 await self.client.pay_challenge(
                     invoice="lnbc1pjtest", macaroon="mac123", max_sats=0
                 )
+
+
+class TestFetch:
+    """Tests for the streaming fetch flow (402 → pay → retry)."""
+
+    L402_HEADER = 'L402 macaroon="bWFjYXJvb24=", invoice="lnbc100n1pjtest"'
+
+    def _make_client(self, handler) -> L402Client:
+        """Build a client whose HTTP layer is an httpx.MockTransport."""
+        wallet = AsyncMock()
+        wallet.pay_invoice = AsyncMock(return_value="preimage123")
+        client = L402Client(wallet=wallet)
+        client._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_fetch_success_without_payment(self):
+        """Non-402 responses are returned directly with no payment."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text="free content")
+
+        client = self._make_client(handler)
+        text, paid = await client.fetch("https://api.example.com/data")
+
+        assert text == "free content"
+        assert paid is None
+        client.wallet.pay_invoice.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_status_raises(self):
+        """Non-402 error responses raise L402Error with status and body."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, text="boom")
+
+        client = self._make_client(handler)
+
+        with pytest.raises(L402Error, match="Request failed: 500"):
+            await client.fetch("https://api.example.com/data")
+
+    @pytest.mark.asyncio
+    async def test_fetch_402_pays_and_retries(self):
+        """A 402 challenge is paid and the request retried with the token."""
+        seen_auth: list[str | None] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_auth.append(request.headers.get("Authorization"))
+            if "Authorization" not in request.headers:
+                return httpx.Response(
+                    402, headers={"WWW-Authenticate": self.L402_HEADER}
+                )
+            return httpx.Response(200, text="paid content")
+
+        client = self._make_client(handler)
+
+        decoded = AsyncMock()
+        decoded.amount_msat = 100_000  # 100 sats
+        with patch(
+            "lightning_enable_mcp.l402_client.decode_bolt11", return_value=decoded
+        ):
+            text, paid = await client.fetch(
+                "https://api.example.com/data", max_sats=1000
+            )
+
+        assert text == "paid content"
+        assert paid == 100
+        client.wallet.pay_invoice.assert_called_once_with("lnbc100n1pjtest")
+        assert seen_auth == [None, "L402 bWFjYXJvb24=:preimage123"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_402_exceeds_max_sats(self):
+        """A challenge above max_sats fails before any payment."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                402, headers={"WWW-Authenticate": self.L402_HEADER}
+            )
+
+        client = self._make_client(handler)
+
+        decoded = AsyncMock()
+        decoded.amount_msat = 5_000_000  # 5000 sats
+        with patch(
+            "lightning_enable_mcp.l402_client.decode_bolt11", return_value=decoded
+        ):
+            with pytest.raises(L402BudgetExceededError, match="exceeds maximum"):
+                await client.fetch("https://api.example.com/data", max_sats=1000)
+
+        client.wallet.pay_invoice.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_402_without_www_authenticate(self):
+        """A 402 without a WWW-Authenticate header raises L402Error."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(402)
+
+        client = self._make_client(handler)
+
+        with pytest.raises(L402Error, match="without WWW-Authenticate"):
+            await client.fetch("https://api.example.com/data")
+
+    @pytest.mark.asyncio
+    async def test_fetch_retry_failure_after_payment(self):
+        """An error response on the paid retry raises L402Error."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "Authorization" not in request.headers:
+                return httpx.Response(
+                    402, headers={"WWW-Authenticate": self.L402_HEADER}
+                )
+            return httpx.Response(403, text="invalid token")
+
+        client = self._make_client(handler)
+
+        decoded = AsyncMock()
+        decoded.amount_msat = 100_000
+        with patch(
+            "lightning_enable_mcp.l402_client.decode_bolt11", return_value=decoded
+        ):
+            with pytest.raises(L402Error, match="Request failed after payment: 403"):
+                await client.fetch("https://api.example.com/data")
+
+    @pytest.mark.asyncio
+    async def test_fetch_truncates_large_body(self):
+        """Bodies beyond MAX_RESPONSE_BYTES are truncated, not buffered."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"x" * (MAX_RESPONSE_BYTES + 4096))
+
+        client = self._make_client(handler)
+        text, paid = await client.fetch("https://api.example.com/data")
+
+        assert len(text) == MAX_RESPONSE_BYTES
+        assert paid is None
@@ -120,6 +120,24 @@ class TestNWCConfig:
             "71a8c14c1407c113601079c4302dab36460f0ccd0ad506f1f2dc73b5100e4f3c"
         )
 
+    def test_parse_uri_with_trailing_slash_and_fragment(self):
+        """Test trailing slash and fragment are tolerated like urlparse did."""
+        uri = (
+            "nostr+walletconnect://b889ff5b1513b641e2a139f661a661364979c5beee91842f8f0ef42ab558e9d4/"
+            "?relay=wss://relay.getalby.com/v1"
+            "&secret=71a8c14c1407c113601079c4302dab36460f0ccd0ad506f1f2dc73b5100e4f3c"
+            "#fragment"
+        )
+
+        config = NWCConfig.from_uri(uri)
+
+        assert config.wallet_pubkey == (
+            "b889ff5b1513b641e2a139f661a661364979c5beee91842f8f0ef42ab558e9d4"
+        )
+        assert config.secret == (
+            "71a8c14c1407c113601079c4302dab36460f0ccd0ad506f1f2dc73b5100e4f3c"
+        )
+
     def test_parse_invalid_scheme(self):
         """Test parsing URI with invalid scheme raises error."""
         uri = "http://example.com"
@@ -134,6 +152,13 @@ class TestNWCConfig:
         with pytest.raises(ValueError, match="missing wallet pubkey"):
             NWCConfig.from_uri(uri)
 
+    def test_parse_non_hex_pubkey(self):
+        """Test parsing URI with a non-hex pubkey raises error."""
+        uri = "nostr+walletconnect://not-hex!?relay=wss://relay.example.com&secret=abc"
+
+        with pytest.raises(ValueError, match="not valid hex"):
+            NWCConfig.from_uri(uri)
+
     def test_parse_missing_relay(self):
         """Test parsing URI without relay raises error."""
         uri = (
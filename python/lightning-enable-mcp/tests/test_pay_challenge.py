@@ -4,7 +4,23 @@ import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from lightning_enable_mcp.tools.pay_challenge import pay_l402_challenge
+from lightning_enable_mcp.tools.pay_challenge import (
+    _invoice_amount_sats,
+    pay_l402_challenge,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_invoice_cache():
+    """Reset the memoized invoice decode between tests.
+
+    The tests below reuse the same invoice string with different mocked
+    decode results, which real invoices (amount is encoded in the string)
+    never do.
+    """
+    _invoice_amount_sats.cache_clear()
+    yield
+    _invoice_amount_sats.cache_clear()
 
 
 class TestPayL402ChallengeNoAmountRejection:
@@ -4,10 +4,11 @@ Tests for Pay Invoice Tool
 
 import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 from lightning_enable_mcp.tools.pay_invoice import pay_invoice
 from lightning_enable_mcp.budget import BudgetManager, BudgetExceededError
+from lightning_enable_mcp.exceptions import WalletError
 
 
 class TestPayInvoice:
@@ -106,18 +107,16 @@ class TestPayInvoice:
         assert "per-request limit" in data["error"] or "budget" in data
 
     @pytest.mark.asyncio
-    async def test_successful_payment_returns_preimage(self):
+    async def test_successful_payment_returns_preimage(self, mock_wallet):
         """Test that successful payment returns the preimage."""
-        # Create a mock wallet that returns a preimage
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="abc123preimage")
+        mock_wallet.pay_invoice.return_value = "abc123preimage"
 
         budget_manager = BudgetManager()
 
         result = await pay_invoice(
             invoice="lnbc100n1pj9npjpp5abcdef...",
             max_sats=1000,
-            wallet=wallet,
+            wallet=mock_wallet,
             budget_manager=budget_manager,
         )
         data = json.loads(result)
@@ -127,17 +126,14 @@ class TestPayInvoice:
         assert "Payment successful" in data["message"]
 
     @pytest.mark.asyncio
-    async def test_successful_payment_records_to_budget(self):
+    async def test_successful_payment_records_to_budget(self, mock_wallet):
         """Test that successful payment is recorded in budget manager."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage123")
-
         budget_manager = BudgetManager()
 
         await pay_invoice(
             invoice="lnbc100n1...",
             max_sats=500,
-            wallet=wallet,
+            wallet=mock_wallet,
             budget_manager=budget_manager,
         )
 
@@ -147,75 +143,62 @@ class TestPayInvoice:
         assert budget_manager.session_spent == 500
 
     @pytest.mark.asyncio
-    async def test_mainnet_invoice_accepted(self):
+    async def test_mainnet_invoice_accepted(self, mock_wallet):
         """Test that mainnet (lnbc) invoices are accepted."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage")
-
         result = await pay_invoice(
             invoice="lnbc100n1pj9npjpp5...",
-            wallet=wallet,
+            wallet=mock_wallet,
         )
         data = json.loads(result)
 
         assert data["success"] is True
-        wallet.pay_invoice.assert_called_once()
+        mock_wallet.pay_invoice.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_testnet_invoice_accepted(self):
+    async def test_testnet_invoice_accepted(self, mock_wallet):
         """Test that testnet (lntb) invoices are accepted."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage")
-
         result = await pay_invoice(
             invoice="lntb100n1pj9npjpp5...",
-            wallet=wallet,
+            wallet=mock_wallet,
         )
         data = json.loads(result)
 
         assert data["success"] is True
-        wallet.pay_invoice.assert_called_once()
+        mock_wallet.pay_invoice.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_invoice_normalized_to_lowercase(self):
+    async def test_invoice_normalized_to_lowercase(self, mock_wallet):
         """Test that invoice is normalized to lowercase before payment."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage")
-
         await pay_invoice(
             invoice="LNBC100N1PJ9NPJPP5...",
-            wallet=wallet,
+            wallet=mock_wallet,
         )
 
         # Verify the normalized invoice was passed
-        call_args = wallet.pay_invoice.call_args[0][0]
+        call_args = mock_wallet.pay_invoice.call_args[0][0]
         assert call_args == "lnbc100n1pj9npjpp5..."
         assert call_args.islower()
 
     @pytest.mark.asyncio
-    async def test_invoice_trimmed(self):
+    async def test_invoice_trimmed(self, mock_wallet):
         """Test that invoice whitespace is trimmed."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage")
-
         await pay_invoice(
             invoice="  lnbc100n1pj9npjpp5...  ",
-            wallet=wallet,
+            wallet=mock_wallet,
         )
 
-        call_args = wallet.pay_invoice.call_args[0][0]
+        call_args = mock_wallet.pay_invoice.call_args[0][0]
         assert not call_args.startswith(" ")
         assert not call_args.endswith(" ")
 
     @pytest.mark.asyncio
-    async def test_payment_failure_returns_error(self):
+    async def test_payment_failure_returns_error(self, mock_wallet):
         """Test that wallet payment failure is handled."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(side_effect=Exception("Payment failed: insufficient funds"))
+        mock_wallet.pay_invoice.side_effect = Exception("Payment failed: insufficient funds")
 
         result = await pay_invoice(
             invoice="lnbc100n1...",
-            wallet=wallet,
+            wallet=mock_wallet,
         )
         data = json.loads(result)
 
@@ -223,16 +206,29 @@ class TestPayInvoice:
         assert "insufficient funds" in data["error"] or "Payment failed" in data["error"]
 
     @pytest.mark.asyncio
-    async def test_no_preimage_returns_error(self):
+    async def test_wallet_error_returns_error(self, mock_wallet):
+        """Test that a typed WalletError from the backend is surfaced cleanly."""
+        mock_wallet.pay_invoice.side_effect = WalletError("Payment failed: route not found")
+
+        result = await pay_invoice(
+            invoice="lnbc100n1...",
+            wallet=mock_wallet,
+        )
+        data = json.loads(result)
+
+        assert data["success"] is False
+        assert "route not found" in data["error"] or "Payment failed" in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_no_preimage_returns_error(self, mock_wallet):
         """Test that missing preimage is handled as failure."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value=None)
+        mock_wallet.pay_invoice.return_value = None
 
         budget_manager = BudgetManager()
 
         result = await pay_invoice(
             invoice="lnbc100n1...",
-            wallet=wallet,
+            wallet=mock_wallet,
             budget_manager=budget_manager,
         )
         data = json.loads(result)
@@ -241,16 +237,15 @@ class TestPayInvoice:
         assert "no preimage" in data["error"].lower()
 
     @pytest.mark.asyncio
-    async def test_empty_preimage_returns_error(self):
+    async def test_empty_preimage_returns_error(self, mock_wallet):
         """Test that empty preimage is handled as failure."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="")
+        mock_wallet.pay_invoice.return_value = ""
 
         budget_manager = BudgetManager()
 
         result = await pay_invoice(
             invoice="lnbc100n1...",
-            wallet=wallet,
+            wallet=mock_wallet,
             budget_manager=budget_manager,
         )
         data = json.loads(result)
@@ -259,17 +254,14 @@ class TestPayInvoice:
         assert "no preimage" in data["error"].lower()
 
     @pytest.mark.asyncio
-    async def test_default_max_sats(self):
+    async def test_default_max_sats(self, mock_wallet):
         """Test that default max_sats is 1000."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage")
-
         # Budget manager with per-request limit lower than default
         budget_manager = BudgetManager(max_per_request=500, max_per_session=10000)
 
         result = await pay_invoice(
             invoice="lnbc100n1...",
-            wallet=wallet,
+            wallet=mock_wallet,
             budget_manager=budget_manager,
         )
         data = json.loads(result)
@@ -278,17 +270,14 @@ class TestPayInvoice:
         assert data["success"] is False
 
     @pytest.mark.asyncio
-    async def test_custom_max_sats(self):
+    async def test_custom_max_sats(self, mock_wallet):
         """Test that custom max_sats is respected."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage")
-
         budget_manager = BudgetManager(max_per_request=1000, max_per_session=10000)
 
         result = await pay_invoice(
             invoice="lnbc100n1...",
             max_sats=100,  # Custom lower max
-            wallet=wallet,
+            wallet=mock_wallet,
             budget_manager=budget_manager,
         )
         data = json.loads(result)
@@ -298,17 +287,16 @@ class TestPayInvoice:
         assert budget_manager.session_spent == 100
 
     @pytest.mark.asyncio
-    async def test_failed_payment_recorded_in_budget(self):
+    async def test_failed_payment_recorded_in_budget(self, mock_wallet):
         """Test that failed payments are recorded with failed status."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value=None)  # Simulate failure
+        mock_wallet.pay_invoice.return_value = None  # Simulate failure
 
         budget_manager = BudgetManager()
 
         await pay_invoice(
             invoice="lnbc100n1...",
             max_sats=100,
-            wallet=wallet,
+            wallet=mock_wallet,
             budget_manager=budget_manager,
         )
 
@@ -319,16 +307,13 @@ class TestPayInvoice:
         assert budget_manager.session_spent == 0
 
     @pytest.mark.asyncio
-    async def test_result_includes_truncated_invoice(self):
+    async def test_result_includes_truncated_invoice(self, mock_wallet):
         """Test that result includes truncated invoice for reference."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage")
-
         long_invoice = "lnbc100n1pj9npjpp5" + "x" * 100
 
         result = await pay_invoice(
             invoice=long_invoice,
-            wallet=wallet,
+            wallet=mock_wallet,
         )
         data = json.loads(result)
 
@@ -338,14 +323,11 @@ class TestPayInvoice:
         assert len(data["invoice"]["paid"]) == 33  # 30 chars + "..."
 
     @pytest.mark.asyncio
-    async def test_works_without_budget_manager(self):
+    async def test_works_without_budget_manager(self, mock_wallet):
         """Test that pay_invoice works without a budget manager."""
-        wallet = AsyncMock()
-        wallet.pay_invoice = AsyncMock(return_value="preimage")
-
         result = await pay_invoice(
             invoice="lnbc100n1...",
-            wallet=wallet,
+            wallet=mock_wallet,
             budget_manager=None,
         )
         data = json.loads(result)
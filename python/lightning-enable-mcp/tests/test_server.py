@@ -9,23 +9,31 @@ import json
 from lightning_enable_mcp.server import LightningEnableServer
 
 
+@pytest.fixture(scope="session")
+def server():
+    """One LightningEnableServer shared by read-only tests.
+
+    The handler registry built in __init__ is a constant of the code, not
+    of any individual test, so tests that only inspect it reuse a single
+    instance. Tests that call _initialize_services still construct their
+    own server because that mutates wallet/l402_client/budget_manager.
+    """
+    return LightningEnableServer()
+
+
 class TestLightningEnableServer:
     """Tests for LightningEnableServer."""
 
-    def test_server_initialization(self):
+    def test_server_initialization(self, server):
         """Test server initializes correctly."""
-        server = LightningEnableServer()
-
         assert server.server is not None
         assert server.wallet is None
         assert server.l402_client is None
         assert server.budget_manager is None
 
     @pytest.mark.asyncio
-    async def test_list_tools_returns_all_tools(self):
+    async def test_list_tools_returns_all_tools(self, server):
         """Test that the list_tools handler is registered on the underlying MCP Server."""
-        server = LightningEnableServer()
-
         # The @self.server.list_tools() decorator in _setup_handlers registers
         # a handler in the underlying mcp Server's request_handlers dict.
         # An earlier version of this test referenced a private `_tool_handlers`
@@ -82,19 +90,17 @@ class TestLightningEnableServer:
 class TestToolSchemas:
     """Tests for tool input schemas."""
 
-    def test_access_l402_resource_schema(self):
+    def test_access_l402_resource_schema(self, server):
         """Test access_l402_resource has correct schema."""
-        server = LightningEnableServer()
-
         # Find the tool definition
         # Tools are registered via decorators, check the handler exists
         assert hasattr(server, "_setup_handlers")
 
-    def test_pay_l402_challenge_requires_invoice_and_macaroon(self):
+    def test_pay_l402_challenge_requires_invoice_and_macaroon(self, server):
         """Test pay_l402_challenge requires invoice and macaroon."""
-        # The schema defined in server.py should have these as required
-        server = LightningEnableServer()
-        # Schema validation is done by MCP framework
+        # The schema defined in server.py should have these as required;
+        # schema validation is done by the MCP framework
+        assert server.server is not None
 
 
 class TestToolResponses: